@@ -0,0 +1,241 @@
+"""Persistent on-disk cache of reprojected overview levels.
+
+Loading a zoomed-out level means opening the GeoTIFF, reading a decimated
+band set and reprojecting it to Web Mercator. For a directory that was
+already viewed, that work gives the same result as last time, so the RGBA
+array and its metadata are saved under the user cache directory and reused
+while the source file is unchanged.
+
+Entries are keyed by the source's absolute path, the geo/pixel mode and the
+overview level, and are validated against the file's size and modification
+time. Only coarse levels are stored (entries are capped in size) and the
+directory is pruned oldest-first once a running size total grows past its
+budget.
+"""
+import hashlib
+import json
+import os
+import platform
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+from affine import Affine
+from rasterio.crs import CRS
+
+from .debug_log import debug
+
+# Bump when the stored layout changes so older entries are ignored.
+CACHE_FORMAT_VERSION = 1
+# Largest single RGBA array worth caching (coarse levels are far smaller).
+CACHE_MAX_ENTRY_BYTES = 32 * 1024 * 1024
+# Total budget for the cache directory before old entries are pruned.
+CACHE_MAX_TOTAL_BYTES = 512 * 1024 * 1024
+
+
+def get_cache_dir() -> Path:
+    """Get the directory for cached overview levels (platform-specific)."""
+    if platform.system() == "Windows":
+        base = Path(os.environ.get("LOCALAPPDATA", tempfile.gettempdir()))
+        return base / "GeoLabeller" / "cache" / "levels"
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "geolabel" / "levels"
+
+
+class OverviewCache:
+    """Store and reuse reprojected RGBA levels keyed by source file state.
+
+    Safe to use from several worker threads: entries are written to a
+    temporary file and moved into place, so a reader never sees a partial
+    entry, and any I/O error simply counts as a cache miss.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for entries; defaults to ``get_cache_dir()``.
+                Created on first store.
+        """
+        self._dir = cache_dir or get_cache_dir()
+        # Running size of the directory, measured on the first store and
+        # then kept up to date, so stores don't rescan the directory
+        self._total_bytes: int | None = None
+        self._lock = threading.Lock()
+
+    def _entry_paths(self, file_path: str, geo: bool,
+                     level: int) -> tuple[Path, Path]:
+        """Return the (array, metadata) paths for one cache entry."""
+        digest = hashlib.sha1(
+            os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        stem = f"{digest}.{'geo' if geo else 'px'}.L{level}"
+        return self._dir / f"{stem}.npy", self._dir / f"{stem}.json"
+
+    @staticmethod
+    def _source_state(file_path: str) -> dict | None:
+        """Return the size/mtime fingerprint of the source file, or None."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    def load(self, file_path: str, geo: bool, level: int) -> dict | None:
+        """Return a cached level result, or None on a miss or stale entry.
+
+        Args:
+            file_path: Source GeoTIFF path
+            geo: True for a reprojected (georeferenced) layer
+            level: Overview decimation factor
+
+        Returns:
+            A dict in the ``TiledLayer.apply_level_result`` format, without
+            overview metadata (the live layer already has that).
+        """
+        npy_path, meta_path = self._entry_paths(file_path, geo, level)
+        state = self._source_state(file_path)
+        if state is None:
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if (meta.get("version") != CACHE_FORMAT_VERSION
+                    or meta.get("source") != state):
+                return None
+            rgba = np.load(npy_path, allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+
+        src_crs = meta["src_crs"]
+        src_transform = meta["src_transform"]
+        return {
+            'rgba': rgba,
+            'width': meta["width"],
+            'height': meta["height"],
+            'bounds': tuple(meta["bounds"]),
+            'full_width': meta["full_width"],
+            'full_height': meta["full_height"],
+            'src_crs': CRS.from_wkt(src_crs) if src_crs else None,
+            'src_transform': (Affine(*src_transform)
+                              if src_transform else None),
+            'src_width': meta["src_width"],
+            'src_height': meta["src_height"],
+            'level': meta["level"],
+        }
+
+    def store(self, file_path: str, geo: bool, level: int,
+              result: dict) -> None:
+        """Save a level result if it is small enough to be worth caching.
+
+        Never raises: the cache is an optimisation, so any failure is
+        reported as a warning and the entry is skipped.
+
+        Args:
+            file_path: Source GeoTIFF path
+            geo: True for a reprojected (georeferenced) layer
+            level: Overview decimation factor that was requested
+            result: Level result as produced by ``_LevelLoadRunnable``
+        """
+        try:
+            self._store(file_path, geo, level, result)
+        except Exception as e:
+            print(f"Warning: could not cache level for {file_path}: {e}")
+
+    def _store(self, file_path: str, geo: bool, level: int,
+               result: dict) -> None:
+        """Write one cache entry (see ``store``)."""
+        rgba = result.get('rgba')
+        if rgba is None or rgba.nbytes > CACHE_MAX_ENTRY_BYTES:
+            return
+        state = self._source_state(file_path)
+        if state is None:
+            return
+
+        src_crs = result.get('src_crs')
+        src_transform = result.get('src_transform')
+        meta = {
+            "version": CACHE_FORMAT_VERSION,
+            "source": state,
+            "path": os.path.abspath(file_path),
+            "width": result['width'],
+            "height": result['height'],
+            "bounds": list(result['bounds']),
+            "full_width": result.get('full_width', 0),
+            "full_height": result.get('full_height', 0),
+            "src_crs": src_crs.to_wkt() if src_crs else None,
+            "src_transform": (list(src_transform)[:6]
+                              if src_transform else None),
+            "src_width": result['src_width'],
+            "src_height": result['src_height'],
+            "level": result['level'],
+        }
+
+        npy_path, meta_path = self._entry_paths(file_path, geo, level)
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            # Write both parts under temporary names, then move them into
+            # place; the metadata goes last so a reader never pairs it with
+            # a half-written array.
+            tmp_npy = npy_path.with_name(
+                f"{npy_path.name}.{os.getpid()}.{id(result)}.tmp")
+            with open(tmp_npy, "wb") as f:
+                np.save(f, np.ascontiguousarray(rgba), allow_pickle=False)
+            os.replace(tmp_npy, npy_path)
+            tmp_meta = meta_path.with_name(f"{tmp_npy.name}.json")
+            with open(tmp_meta, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta, meta_path)
+            written = npy_path.stat().st_size + meta_path.stat().st_size
+        except OSError as e:
+            print(f"Warning: could not cache level for {file_path}: {e}")
+            return
+
+        # Replacing an existing entry overcounts; that only brings the next
+        # prune (which re-measures the directory) forward.
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += written
+            if self._total_bytes <= CACHE_MAX_TOTAL_BYTES:
+                return
+            self._total_bytes = self._prune()
+
+    def _scan_entries(self) -> list[tuple[float, int, str]]:
+        """Return (mtime, size, path) for every file in the cache directory."""
+        try:
+            with os.scandir(self._dir) as it:
+                return [(e.stat().st_mtime, e.stat().st_size, e.path)
+                        for e in it if e.is_file()]
+        except OSError:
+            return []
+
+    def _scan_total(self) -> int:
+        """Measure the cache directory's total size in bytes."""
+        return sum(size for _mtime, size, _path in self._scan_entries())
+
+    def _prune(self) -> int:
+        """Delete the oldest entries once the cache exceeds its budget.
+
+        Returns:
+            The directory's total size in bytes afterwards
+        """
+        entries = self._scan_entries()
+        total = sum(size for _mtime, size, _path in entries)
+        if total <= CACHE_MAX_TOTAL_BYTES:
+            return total
+        for _mtime, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= CACHE_MAX_TOTAL_BYTES * 0.8:
+                break
+        debug(f"level cache pruned to {total / (1024 * 1024):.0f} MB")
+        return total
+
+
+# Shared instance used by the canvas level loader.
+LEVEL_CACHE = OverviewCache()
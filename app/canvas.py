@@ -1,6 +1,8 @@
 """Map canvas for displaying GeoTIFF images with tiled rendering."""
 import math
 import traceback
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum, auto
 from pathlib import Path
 
@@ -29,12 +31,17 @@ from rasterio.crs import CRS
 from rasterio.warp import calculate_default_transform, reproject, Resampling, transform as transform_coords
 
 from .labels import haversine_distance
+from .cache import LEVEL_CACHE
 from .debug_log import debug
 
 
 # Web Mercator CRS
 WEB_MERCATOR = CRS.from_epsg(3857)
 TILE_SIZE = 512  # Pixels per tile
+# Minimum interval between coordinates_changed emits (~60 Hz, one frame)
+COORDS_EMIT_INTERVAL_MS = 16
+# Byte budget for the LRU cache of converted tile pixmaps (RGBA, 4 B/pixel)
+TILE_CACHE_BYTES = 256 * 1024 * 1024
 
 # Pixel zone: non-georeferenced images are placed beyond valid Web Mercator bounds.
 # Scene units are scaled so pixel images have similar visual size to typical geo images.
@@ -75,13 +82,16 @@ class TiledLayer:
     """
 
     def __init__(self, file_path: str, lazy: bool = False,
-                 geo: bool = True):
+                 geo: bool = True, header: dict | None = None):
         """Initialize a tiled layer.
 
         Args:
             file_path: Path to the GeoTIFF file
             lazy: If True, only load bounds initially, defer full data loading
             geo: If True (default), reproject to Web Mercator. If False, use raw pixel coordinates.
+            header: Optional metadata already read by ``read_layer_header``
+                (e.g. on a loader thread). For lazy layers this replaces the
+                bounds-only read so the file isn't opened again here.
         """
         self.file_path = file_path
         self.name = Path(file_path).stem  # File name without extension
@@ -138,7 +148,9 @@ class TiledLayer:
         self._lazy = lazy
         self._fully_loaded = False
 
-        if geo:
+        if lazy and header is not None:
+            self._apply_header(header)
+        elif geo:
             if lazy:
                 self._load_bounds_only()
             else:
@@ -193,6 +205,31 @@ class TiledLayer:
             self._n_tiles_x = math.ceil(width / TILE_SIZE)
             self._n_tiles_y = math.ceil(height / TILE_SIZE)
 
+    def _apply_header(self, header: dict):
+        """Set bounds and metadata from a ``read_layer_header`` result.
+
+        Equivalent to ``_load_bounds_only`` / ``_load_pixel_bounds_only``
+        without touching the file.
+        """
+        self._src_crs = header['src_crs']
+        self._src_transform = header['src_transform']
+        self._src_width = header['src_width']
+        self._src_height = header['src_height']
+        self._overviews = list(header.get('overviews', []))
+        self._src_level_dims = list(header.get('level_dims', []))
+
+        width = header['width']
+        height = header['height']
+        self._full_width = width
+        self._full_height = height
+        self._width = width
+        self._height = height
+        self.bounds = header['bounds']
+
+        # Calculate tile grid
+        self._n_tiles_x = math.ceil(width / TILE_SIZE)
+        self._n_tiles_y = math.ceil(height / TILE_SIZE)
+
     def ensure_loaded(self, level: int | None = None):
         """Ensure raster data is loaded, optionally at a specific overview level.
 
@@ -218,6 +255,12 @@ class TiledLayer:
         """Return True if the source file exposes pyramid overviews."""
         return bool(self._overviews)
 
+    def set_overview_metadata(self, overviews: list[int],
+                              level_dims: list[tuple[int, int]]) -> None:
+        """Replace the pyramid metadata (e.g. after overviews were built)."""
+        self._overviews = list(overviews)
+        self._src_level_dims = list(level_dims)
+
     def select_overview_level(self, scene_units_per_pixel: float) -> int:
         """Return the coarsest overview decimation factor suitable for display.
 
@@ -755,6 +798,77 @@ class TiledLayer:
         return (pixel_x, pixel_y)
 
 
+def read_layer_header(file_path: str) -> dict:
+    """Read the metadata needed to register a lazy layer, without pixel data.
+
+    Safe to call off the UI thread. The result can be passed to
+    ``MapCanvas.add_layer`` / ``add_pixel_layer`` as ``header`` so the file is
+    not reopened on the UI thread.
+
+    Args:
+        file_path: Path to the raster file
+
+    Returns:
+        Dict with Web Mercator (or pixel) bounds and size, the source CRS,
+        transform and size, overview factors/dims and a ``geo`` flag.
+    """
+    with rasterio.open(file_path) as src:
+        src_crs = src.crs
+        try:
+            overviews = list(src.overviews(1))
+        except Exception:
+            overviews = []
+        level_dims = [
+            (max(1, src.width // f), max(1, src.height // f))
+            for f in overviews
+        ]
+
+        if src.crs is not None:
+            transform, width, height = calculate_default_transform(
+                src.crs, WEB_MERCATOR, src.width, src.height, *src.bounds
+            )
+            bounds = rasterio.transform.array_bounds(
+                height, width, transform)
+            geo = True
+        else:
+            width = src.width
+            height = src.height
+            bounds = (0, 0, width, height)
+            geo = False
+
+        return {
+            'bounds': bounds,
+            'width': width,
+            'height': height,
+            'src_crs': src_crs,
+            'src_transform': src.transform,
+            'src_width': src.width,
+            'src_height': src.height,
+            'overviews': overviews,
+            'level_dims': level_dims,
+            'geo': geo,
+        }
+
+
+class _HeaderReadRunnable(QRunnable):
+    """Read one file's layer header on a pool thread into a result slot."""
+
+    def __init__(self, file_path: str, results: list, index: int):
+        """Store the file and the shared result list slot to fill."""
+        super().__init__()
+        self._file_path = file_path
+        self._results = results
+        self._index = index
+
+    def run(self):
+        """Read the header and store ``(header, None)`` or ``(None, error)``."""
+        try:
+            self._results[self._index] = (
+                read_layer_header(self._file_path), None)
+        except Exception as e:
+            self._results[self._index] = (None, str(e))
+
+
 class AsyncFileLoader(QObject):
     """Worker object for loading GeoTIFF files asynchronously in a background thread.
 
@@ -793,60 +907,49 @@ class AsyncFileLoader(QObject):
         """Cancel the loading operation."""
         self._cancelled = True
 
+    # Files whose headers are read concurrently before results are emitted
+    # (in input order, so the layer tree keeps the sorted file order).
+    HEADER_BATCH_SIZE = 32
+
     def process(self):
-        """Process all files in the queue. Run this in a worker thread."""
+        """Process all files in the queue. Run this in a worker thread.
+
+        Headers are read in batches on a private QThreadPool; GDAL releases
+        the GIL while opening files, so several reads overlap, which hides
+        latency on slow or network storage.
+        """
         loaded_count = 0
         error_count = 0
         total = len(self._files_to_load)
+        pool = QThreadPool()
 
-        for i, (file_path, group_path) in enumerate(self._files_to_load):
+        for start in range(0, total, self.HEADER_BATCH_SIZE):
             if self._cancelled:
                 break
 
-            try:
-                with rasterio.open(file_path) as src:
-                    src_crs = src.crs
-                    src_transform = src.transform
-                    src_width = src.width
-                    src_height = src.height
-
-                    if src.crs is not None:
-                        dst_crs = WEB_MERCATOR
-                        transform, width, height = calculate_default_transform(
-                            src.crs, dst_crs, src.width, src.height, *src.bounds
-                        )
-                        bounds = rasterio.transform.array_bounds(
-                            height, width, transform)
-                        geo = True
-                    else:
-                        width = src.width
-                        height = src.height
-                        bounds = (0, 0, width, height)
-                        geo = False
-
-                # Emit the loaded data
-                layer_data = {
-                    'file_path': file_path,
-                    'group_path': group_path,
-                    'bounds': bounds,
-                    'width': width,
-                    'height': height,
-                    'src_crs': src_crs,
-                    'src_transform': src_transform,
-                    'src_width': src_width,
-                    'src_height': src_height,
-                    'geo': geo,
-                }
-                self.file_loaded.emit(file_path, layer_data)
-                loaded_count += 1
-
-            except Exception as e:
-                self.file_error.emit(file_path, str(e))
-                error_count += 1
-
-            # Emit progress every 10 files or at the end
-            if (i + 1) % 10 == 0 or i == total - 1:
-                self.progress_update.emit(i + 1, total)
+            batch = self._files_to_load[start:start + self.HEADER_BATCH_SIZE]
+            results: list = [None] * len(batch)
+            for index, (file_path, _group_path) in enumerate(batch):
+                pool.start(_HeaderReadRunnable(file_path, results, index))
+            pool.waitForDone()
+
+            for offset, ((file_path, group_path), (header, error)) in enumerate(
+                    zip(batch, results)):
+                i = start + offset
+                if error is None:
+                    # Emit the loaded data
+                    layer_data = dict(header)
+                    layer_data['file_path'] = file_path
+                    layer_data['group_path'] = group_path
+                    self.file_loaded.emit(file_path, layer_data)
+                    loaded_count += 1
+                else:
+                    self.file_error.emit(file_path, error)
+                    error_count += 1
+
+                # Emit progress every 10 files or at the end
+                if (i + 1) % 10 == 0 or i == total - 1:
+                    self.progress_update.emit(i + 1, total)
 
         self.batch_complete.emit(loaded_count, error_count)
 
@@ -976,6 +1079,13 @@ class _LevelLoadRunnable(QRunnable):
         if self._cancelled:
             self._safe_emit(self._signals.cancelled, self._layer_id, self._level)
             return
+        # Reuse the level from the on-disk cache when the source is unchanged,
+        # skipping the read and reprojection entirely.
+        result = LEVEL_CACHE.load(self._file_path, self._geo, self._level)
+        if result is not None:
+            self._safe_emit(
+                self._signals.finished, self._layer_id, self._level, result)
+            return
         try:
             tmp = TiledLayer(self._file_path, lazy=True, geo=self._geo)
             tmp.ensure_loaded(level=self._level)
@@ -1001,8 +1111,12 @@ class _LevelLoadRunnable(QRunnable):
         # Discard the result if the view moved on while we were reprojecting.
         if self._cancelled:
             self._safe_emit(self._signals.cancelled, self._layer_id, self._level)
-            return
-        self._safe_emit(self._signals.finished, self._layer_id, self._level, result)
+        else:
+            self._safe_emit(
+                self._signals.finished, self._layer_id, self._level, result)
+        # Cache after delivering, so the disk write never delays the level;
+        # the UI only reads the array, and store() never raises.
+        LEVEL_CACHE.store(self._file_path, self._geo, self._level, result)
 
     @staticmethod
     def _safe_emit(signal, *args):
@@ -1146,6 +1260,9 @@ class MapCanvas(QGraphicsView):
         self._label_items: dict[int,
                                 tuple[QGraphicsEllipseItem,
                                       QGraphicsTextItem]] = {}
+        # IDs of label markers currently drawn highlighted, so highlight
+        # changes only touch the markers whose state actually changes
+        self._highlighted_ids: set[int] = set()
         # Z-value offset for labels (added to max layer z-value to ensure
         # labels are always on top)
         self._label_z_offset = 1000
@@ -1162,18 +1279,36 @@ class MapCanvas(QGraphicsView):
         self._pixel_zone_groups: dict[str, tuple[float, float]] = {}
         self._pixel_zone_next_x = PIXEL_ZONE_ORIGIN_X
 
+        # LRU cache of tile pixmaps: (file_path, level, tx, ty) -> QPixmap.
+        # Panning back over a region reuses the converted pixmap instead of
+        # copying it out of the RGBA buffer again.
+        self._tile_cache: OrderedDict = OrderedDict()
+        self._tile_cache_bytes = 0
+
         # Tile update timer (debounce rapid view changes)
         self._tile_update_timer = QTimer()
         self._tile_update_timer.setSingleShot(True)
         self._tile_update_timer.timeout.connect(self._update_visible_tiles)
 
+        # Batch mode (bulk imports / marker refreshes): per-layer z-order
+        # passes, tile updates and viewport repaints are deferred to the
+        # outermost end_batch_update() so adding N layers or markers costs one
+        # z-order pass and one repaint instead of N. Nests via a depth count.
+        self._batch_mode = False
+        self._batch_depth = 0
+        self._batch_needs_restack = False
+        self._batch_needs_tiles = False
+        # Shared font for label marker text (built on first use)
+        self._label_font: QFont | None = None
+
         # Coordinates emit throttle: coalesce mouseMoveEvent emissions so the
         # status bar isn't updated on every single pixel of mouse motion.
         # _pending_coords holds the latest payload; the timer fires at most
-        # ~33 fps and emits only when the payload differs from the last one.
+        # once per display frame and emits only when the payload differs from
+        # the last one.
         self._coords_emit_timer = QTimer()
         self._coords_emit_timer.setSingleShot(True)
-        self._coords_emit_timer.setInterval(30)
+        self._coords_emit_timer.setInterval(COORDS_EMIT_INTERVAL_MS)
         self._coords_emit_timer.timeout.connect(self._flush_pending_coords)
         self._pending_coords: tuple | None = None
         self._last_emitted_coords: tuple | None = None
@@ -1193,20 +1328,22 @@ class MapCanvas(QGraphicsView):
         self._throbber.move(12, 12)
 
     def add_layer(self, file_path: str, lazy: bool = False,
-                  visible: bool = True) -> str | None:
+                  visible: bool = True,
+                  header: dict | None = None) -> str | None:
         """Add a GeoTIFF layer to the canvas. Returns existing layer_id if already loaded.
 
         Args:
             file_path: Path to the GeoTIFF file
             lazy: If True, only load bounds initially (faster for bulk imports)
             visible: Whether the layer should be visible initially
+            header: Optional ``read_layer_header`` result prepared off-thread
         """
         # Check if this file is already loaded
         if file_path in self._path_to_layer:
             return self._path_to_layer[file_path]
 
         try:
-            layer = TiledLayer(file_path, lazy=lazy)
+            layer = TiledLayer(file_path, lazy=lazy, header=header)
             layer.visible = visible
 
             layer_id = f"layer_{self._next_id}"
@@ -1215,11 +1352,7 @@ class MapCanvas(QGraphicsView):
             self._layers[layer_id] = layer
             self._layer_order.append(layer_id)
             self._path_to_layer[file_path] = layer_id
-            self._update_z_order()
-
-            # Only update tiles if visible (skip for hidden layers)
-            if visible:
-                self._update_visible_tiles()
+            self._after_layer_added(visible)
 
             # Fit view on first layer
             if len(self._layers) == 1:
@@ -1234,8 +1367,60 @@ class MapCanvas(QGraphicsView):
             traceback.print_exc()
             return None
 
+    def begin_batch_update(self):
+        """Begin adding many layers or markers - defers z-order and repaints.
+
+        Call end_batch_update() when done (use try/finally), or use the
+        batch_updates() context manager. Batches may nest; only the outermost
+        end applies the deferred work.
+        """
+        self._batch_depth += 1
+        if self._batch_depth > 1:
+            return
+        self._batch_mode = True
+        self._batch_needs_restack = False
+        self._batch_needs_tiles = False
+        self.viewport().setUpdatesEnabled(False)
+
+    def end_batch_update(self):
+        """End a batch with one z-order pass and repaint."""
+        self._batch_depth = max(0, self._batch_depth - 1)
+        if self._batch_depth > 0:
+            return
+        self._batch_mode = False
+        if self._batch_needs_restack:
+            self._batch_needs_restack = False
+            self._update_z_order()
+        if self._batch_needs_tiles:
+            self._batch_needs_tiles = False
+            self._schedule_tile_update(0)
+        self.viewport().setUpdatesEnabled(True)
+        self.viewport().update()
+
+    @contextmanager
+    def batch_updates(self):
+        """Context manager form of begin_batch_update()/end_batch_update()."""
+        self.begin_batch_update()
+        try:
+            yield
+        finally:
+            self.end_batch_update()
+
+    def _after_layer_added(self, visible: bool):
+        """Restack layers and schedule tiles for a new layer (or defer both)."""
+        if self._batch_mode:
+            self._batch_needs_restack = True
+            self._batch_needs_tiles = self._batch_needs_tiles or visible
+            return
+        self._update_z_order()
+        # Only update tiles if visible (skip for hidden layers). Deferred to
+        # the event loop so adding many layers triggers one update.
+        if visible:
+            self._schedule_tile_update(0)
+
     def add_pixel_layer(self, file_path: str, group_path: str = "",
-                        lazy: bool = False, visible: bool = True) -> str | None:
+                        lazy: bool = False, visible: bool = True,
+                        header: dict | None = None) -> str | None:
         """Add a non-georeferenced image layer to the pixel zone.
 
         Images in the same group are stacked (same position, cycled via visibility).
@@ -1246,12 +1431,13 @@ class MapCanvas(QGraphicsView):
             group_path: Group hierarchy for column layout
             lazy: If True, only load bounds initially
             visible: Whether the layer should be visible initially
+            header: Optional ``read_layer_header`` result prepared off-thread
         """
         if file_path in self._path_to_layer:
             return self._path_to_layer[file_path]
 
         try:
-            layer = TiledLayer(file_path, lazy=lazy, geo=False)
+            layer = TiledLayer(file_path, lazy=lazy, geo=False, header=header)
             layer.visible = visible
             layer.group_path = group_path
 
@@ -1265,10 +1451,7 @@ class MapCanvas(QGraphicsView):
             self._layers[layer_id] = layer
             self._layer_order.append(layer_id)
             self._path_to_layer[file_path] = layer_id
-            self._update_z_order()
-
-            if visible:
-                self._update_visible_tiles()
+            self._after_layer_added(visible)
 
             return layer_id
 
@@ -1403,7 +1586,7 @@ class MapCanvas(QGraphicsView):
         # Add newly visible tiles
         for idx in visible_indices - current_indices:
             tx, ty = idx
-            pixmap = layer.create_tile_pixmap(tx, ty)
+            pixmap = self._get_tile_pixmap(layer, tx, ty)
             if pixmap is None:
                 continue
 
@@ -1428,6 +1611,33 @@ class MapCanvas(QGraphicsView):
 
             layer.tiles[idx] = item
 
+    def _get_tile_pixmap(self, layer: TiledLayer, tx: int,
+                         ty: int) -> QPixmap | None:
+        """Return a tile pixmap from the LRU cache, creating it on a miss."""
+        key = (layer.file_path, layer._loaded_level, tx, ty)
+        pixmap = self._tile_cache.get(key)
+        if pixmap is not None:
+            self._tile_cache.move_to_end(key)
+            return pixmap
+
+        pixmap = layer.create_tile_pixmap(tx, ty)
+        if pixmap is None:
+            return None
+        self._tile_cache[key] = pixmap
+        self._tile_cache_bytes += pixmap.width() * pixmap.height() * 4
+
+        # Evict least recently used tiles until back under budget
+        while self._tile_cache_bytes > TILE_CACHE_BYTES and self._tile_cache:
+            _, old = self._tile_cache.popitem(last=False)
+            self._tile_cache_bytes -= old.width() * old.height() * 4
+        return pixmap
+
+    def drop_cached_tiles(self, file_path: str):
+        """Remove all cached tile pixmaps for a layer's file."""
+        for key in [k for k in self._tile_cache if k[0] == file_path]:
+            pixmap = self._tile_cache.pop(key)
+            self._tile_cache_bytes -= pixmap.width() * pixmap.height() * 4
+
     def _clear_layer_tiles(self, layer: TiledLayer):
         """Remove all of a layer's tiles from the scene."""
         for item in layer.tiles.values():
@@ -1583,10 +1793,14 @@ class MapCanvas(QGraphicsView):
             self._loading_active = active
             self.loading_changed.emit(active)
 
+    def _schedule_tile_update(self, delay_ms: int = 50):
+        """Schedule a tile update (debounced).
 
-    def _schedule_tile_update(self):
-        """Schedule a tile update (debounced)."""
-        self._tile_update_timer.start(50)  # 50ms debounce
+        Args:
+            delay_ms: Debounce delay. 0 runs the update on the next event
+                loop pass, still coalescing a burst of calls into one.
+        """
+        self._tile_update_timer.start(delay_ms)
 
     def set_layer_visibility(self, layer_id: str, visible: bool):
         """Show or hide a layer."""
@@ -1594,7 +1808,8 @@ class MapCanvas(QGraphicsView):
             layer = self._layers[layer_id]
             layer.set_visibility(visible)
             if visible:
-                self._update_visible_tiles()
+                # Coalesce: toggling a whole group shows many layers in a row
+                self._schedule_tile_update(0)
             else:
                 # Hidden layers shouldn't keep loading in the background.
                 self._cancel_layer_load(layer)
@@ -1637,6 +1852,7 @@ class MapCanvas(QGraphicsView):
             self._cancel_layer_load(self._layers[layer_id])
             self._layers[layer_id].remove_from_scene(self._scene)
             del self._layers[layer_id]
+            self.drop_cached_tiles(file_path)
             if file_path in self._path_to_layer:
                 del self._path_to_layer[file_path]
             if layer_id in self._layer_order:
@@ -1649,6 +1865,8 @@ class MapCanvas(QGraphicsView):
         self._layers.clear()
         self._layer_order.clear()
         self._path_to_layer.clear()
+        self._tile_cache.clear()
+        self._tile_cache_bytes = 0
         self._pixel_zone_groups.clear()
         self._pixel_zone_next_x = PIXEL_ZONE_ORIGIN_X
 
@@ -2230,8 +2448,8 @@ class MapCanvas(QGraphicsView):
         if color is None:
             color = QColor(255, 50, 50)  # Default red
 
-        # Determine scene position based on whether layer is georeferenced
-        layer = self._get_layer_by_name_and_group(image_name, image_group)
+        # Determine scene position based on whether layer is georeferenced.
+        layer = self._find_label_layer(image_path, image_name, image_group)
         if layer and not layer.geo and pixel_x is not None and pixel_y is not None:
             # Non-geo layer: compute scene position from pixel coords
             # pixel_y=0 is top of image (north), increasing downward
@@ -2248,29 +2466,113 @@ class MapCanvas(QGraphicsView):
         # Marker size in scene coordinates (appears ~10 pixels on screen)
         marker_size = 10 / view_scale if view_scale > 0 else 10
 
+        self._create_label_marker(
+            label_id, x, y, image_path, class_name,
+            QPen(color.darker(150), marker_size / 5), QBrush(color),
+            marker_size, self._get_label_z_base())
+
+    def add_label_markers(self, columns: dict[str, np.ndarray],
+                          images: list[tuple[str, str, str]],
+                          class_names: list[str], palette: list[QColor]):
+        """Add markers for many labels at once.
+
+        Positions for all georeferenced labels are projected to Web Mercator
+        in one vectorized pass, and marker size, z-value, pens and brushes are
+        computed once per call (per class for colours) instead of per label.
+
+        Args:
+            columns: Parallel label arrays from ``LabelProject.as_arrays``
+                (``id``, ``lon``, ``lat``, ``pixel_x``, ``pixel_y``,
+                ``class_idx``)
+            images: Per-label (image_name, image_group, image_path)
+            class_names: Per-label class name (marker text)
+            palette: Colour per class index; the last entry is used for
+                labels whose class index is -1 (unknown class)
+        """
+        count = len(columns['id'])
+        if count == 0:
+            return
+
+        # Web Mercator for every label (only used for geo layers)
+        R = 6378137.0
+        xs = np.radians(columns['lon']) * R
+        ys = np.log(np.tan(np.pi / 4 + np.radians(columns['lat']) / 2)) * R
+
+        view_scale = self._view_scale()
+        marker_size = 10 / view_scale if view_scale > 0 else 10
+        label_z = self._get_label_z_base()
+        styles = [(QPen(color.darker(150), marker_size / 5), QBrush(color))
+                  for color in palette]
+
+        layer_cache: dict[str, TiledLayer | None] = {}
+        ids = columns['id'].tolist()
+        pixel_xs = columns['pixel_x'].tolist()
+        pixel_ys = columns['pixel_y'].tolist()
+        class_idx = columns['class_idx'].tolist()
+        xs = xs.tolist()
+        ys = ys.tolist()
+        for i in range(count):
+            image_name, image_group, image_path = images[i]
+            if image_path in layer_cache:
+                layer = layer_cache[image_path]
+            else:
+                layer = self._find_label_layer(
+                    image_path, image_name, image_group)
+                layer_cache[image_path] = layer
+
+            if layer is not None and not layer.geo:
+                west, _, _, north = layer.bounds
+                x = west + pixel_xs[i] * PIXEL_ZONE_SCALE
+                y = north - pixel_ys[i] * PIXEL_ZONE_SCALE
+            else:
+                x, y = xs[i], ys[i]
+
+            pen, brush = styles[class_idx[i]]
+            self._create_label_marker(
+                ids[i], x, y, image_path, class_names[i], pen, brush,
+                marker_size, label_z)
+
+    def _find_label_layer(self, image_path: str, image_name: str,
+                          image_group: str):
+        """Return the layer a label belongs to (None if not loaded).
+
+        The path lookup is O(1); the name/group scan is only a fallback.
+        """
+        layer_id = self._path_to_layer.get(image_path)
+        layer = self._layers.get(layer_id) if layer_id else None
+        if layer is None:
+            layer = self._get_layer_by_name_and_group(image_name, image_group)
+        return layer
+
+    def _create_label_marker(self, label_id: int, x: float, y: float,
+                             image_path: str, class_name: str, pen: QPen,
+                             brush: QBrush, marker_size: float,
+                             label_z: float):
+        """Create and register the ellipse + text items for one label."""
         # Create ellipse marker
         ellipse = QGraphicsEllipseItem(
             -marker_size / 2, -marker_size / 2,
             marker_size, marker_size
         )
         ellipse.setPos(x, -y)  # Y is flipped in scene coords
-        ellipse.setPen(QPen(color.darker(150), marker_size / 5))
-        ellipse.setBrush(QBrush(color))
-        ellipse.setZValue(self._get_label_z_base())
+        ellipse.setPen(pen)
+        ellipse.setBrush(brush)
+        ellipse.setZValue(label_z)
         ellipse.setData(0, image_path)  # Store image_path for later retrieval
 
         # Create text label
         text = QGraphicsTextItem(class_name)
         text.setData(0, class_name)  # base label text, for measurement relabeling
         text.setDefaultTextColor(Qt.white)
-        font = QFont("Arial", 8)
-        font.setBold(True)
-        text.setFont(font)
+        if self._label_font is None:
+            self._label_font = QFont("Arial", 8)
+            self._label_font.setBold(True)
+        text.setFont(self._label_font)
         # Ignore the view transform so the label stays upright and a constant
         # on-screen size even when the view is rotated (image-up cycle mode).
         text.setFlag(QGraphicsItem.ItemIgnoresTransformations, True)
         text.setPos(x + marker_size / 2, -y - marker_size / 2)
-        text.setZValue(self._get_label_z_base() + 1)
+        text.setZValue(label_z + 1)
 
         self._scene.addItem(ellipse)
         self._scene.addItem(text)
@@ -2284,6 +2586,7 @@ class MapCanvas(QGraphicsView):
             self._scene.removeItem(ellipse)
             self._scene.removeItem(text)
             del self._label_items[label_id]
+            self._highlighted_ids.discard(label_id)
 
     def clear_label_markers(self):
         """Remove all label markers from the canvas."""
@@ -2872,9 +3175,25 @@ class MapCanvas(QGraphicsView):
                         ellipse.pen().widthF() *
                         1.5)
                     ellipse.setPen(highlight_pen)
+                    self._highlighted_ids.add(label_id)
                 else:
                     # Restore original pen
                     original_pen = ellipse.data(3)
                     if original_pen:
                         ellipse.setPen(original_pen)
                         ellipse.setData(3, None)
+                    self._highlighted_ids.discard(label_id)
+
+    def set_highlight_set(self, label_ids: set[int]):
+        """Make exactly ``label_ids`` the highlighted label markers.
+
+        Only markers whose state changes are touched: previously highlighted
+        ones not in the new set are restored, new ones are highlighted.
+        """
+        label_ids = set(label_ids)
+        to_off = self._highlighted_ids - label_ids
+        to_on = label_ids - self._highlighted_ids
+        if to_off:
+            self.highlight_labels(list(to_off), highlight=False)
+        if to_on:
+            self.highlight_labels(list(to_on), highlight=True)
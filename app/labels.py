@@ -6,11 +6,19 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from affine import Affine
 from pyproj import Transformer
 from rasterio.crs import CRS
 from rasterio.warp import transform as transform_coords
 
+try:
+    # Optional: encodes indented JSON several times faster than the stdlib,
+    # whose C encoder is not used when indenting.
+    import orjson
+except ImportError:
+    orjson = None
+
 # WGS84 CRS (EPSG:4326)
 WGS84 = CRS.from_epsg(4326)
 
@@ -18,6 +26,41 @@ WGS84 = CRS.from_epsg(4326)
 EARTH_RADIUS_M = 6371008.8
 
 
+def _dumps_indented(value) -> bytes:
+    """Encode a value as 2-space-indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode("utf-8")
+
+
+def write_project_json(data: dict, file_path: str | Path):
+    """Write project-format data as indented UTF-8 JSON.
+
+    The "images" entry may be any iterable (e.g. a generator of
+    ImageData.to_dict() results); it is encoded and written one image at a
+    time, so the full image list and the full encoded document never have
+    to be held in memory together. Uses orjson when installed, otherwise
+    the standard json module; the layout matches json.dumps(indent=2).
+    """
+    with open(file_path, 'wb', buffering=1 << 20) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(data.items()):
+            f.write(b"\n  " if i == 0 else b",\n  ")
+            f.write(_dumps_indented(key) + b": ")
+            if key != "images":
+                f.write(_dumps_indented(value).replace(b"\n", b"\n  "))
+                continue
+            # Stream the image list; raw newlines only occur between tokens
+            # (string newlines are escaped), so re-indenting is a replace
+            empty = True
+            for image in value:
+                f.write(b"[\n    " if empty else b",\n    ")
+                f.write(_dumps_indented(image).replace(b"\n", b"\n    "))
+                empty = False
+            f.write(b"[]" if empty else b"\n  ]")
+        f.write(b"\n}" if data else b"}")
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate geodesic distance between two WGS84 points using Haversine formula.
 
@@ -41,7 +84,9 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return EARTH_RADIUS_M * c
 
 
-@dataclass
+# slots: projects can hold tens of thousands of labels; without a per-instance
+# __dict__ each one is smaller and attribute access is faster
+@dataclass(slots=True)
 class PointLabel:
     """A single point label annotation."""
 
@@ -422,6 +467,9 @@ class LabelProject:
     # Index mapping label_id -> (image_path, label) for O(1) label lookup
     _label_id_index: dict[int, tuple[str, PointLabel]] = field(default_factory=dict)
 
+    # Index mapping class_name -> set of label_ids for class-wide operations
+    _class_index: dict[str, set[int]] = field(default_factory=dict)
+
     def _index_object_id(self, label: PointLabel):
         """Add a label to the object_id index only."""
         if label.object_id not in self._object_id_index:
@@ -439,17 +487,24 @@ class LabelProject:
         """Add a label to all indexes."""
         self._index_object_id(label)
         self._label_id_index[label.id] = (image_path, label)
+        self._class_index.setdefault(label.class_name, set()).add(label.id)
 
     def _unindex_label(self, label: PointLabel):
         """Remove a label from all indexes."""
         self._unindex_object_id(label)
         if label.id in self._label_id_index:
             del self._label_id_index[label.id]
+            class_ids = self._class_index.get(label.class_name)
+            if class_ids is not None:
+                class_ids.discard(label.id)
+                if not class_ids:
+                    del self._class_index[label.class_name]
 
     def _rebuild_index(self):
         """Rebuild all indexes from scratch (used after loading)."""
         self._object_id_index.clear()
         self._label_id_index.clear()
+        self._class_index.clear()
         for image_path, image in self.images.items():
             for label in image.labels:
                 self._index_label(label, image_path)
@@ -462,18 +517,31 @@ class LabelProject:
         return False
 
     def remove_class(self, class_name: str):
-        """Remove a class and all labels with that class."""
+        """Remove a class and all labels with that class.
+
+        Labels are removed even if the name is no longer in ``classes``, so
+        callers may update the class list first.
+        """
         if class_name in self.classes:
             self.classes.remove(class_name)
-            # Remove labels with this class from all images
-            for image in self.images.values():
-                # Unindex labels being removed
-                for label in image.labels:
-                    if label.class_name == class_name:
-                        self._unindex_label(label)
+        # Only images holding labels of this class need filtering
+        affected = set()
+        for label_id in list(self._class_index.get(class_name, ())):
+            image_path, label = self._label_id_index[label_id]
+            self._unindex_label(label)
+            affected.add(image_path)
+        for image_path in affected:
+            image = self.images.get(image_path)
+            if image is not None:
                 image.labels = [
                     l for l in image.labels if l.class_name != class_name]
 
+    def set_classes(self, classes: list[str]):
+        """Replace the class list, deleting labels of classes not in it."""
+        for class_name in set(self.classes) - set(classes):
+            self.remove_class(class_name)
+        self.classes = list(classes)
+
     def add_image(self, path: str, name: str, group: str = "",
                   original_width: int = 0, original_height: int = 0,
                   reader: dict[str, str] | None = None,
@@ -503,6 +571,25 @@ class LabelProject:
             img.set_affine(affine, crs)
         return img
 
+    def add_images(self, entries):
+        """Add many images in one pass (bulk form of add_image).
+
+        Args:
+            entries: Iterable of (path, name, group, original_width,
+                original_height, affine, crs) tuples; affine/crs may be None
+        """
+        images = self.images
+        for path, name, group, width, height, affine, crs in entries:
+            img = images.get(path)
+            if img is None:
+                img = images[path] = ImageData(
+                    path=path, name=name, group=group,
+                    original_width=width, original_height=height,
+                    reader={})
+            if (affine is not None and crs is not None
+                    and img.affine_coeffs is None):
+                img.set_affine(affine, crs)
+
     def update_image_group(self, path: str, group: str):
         """Update the group for an image."""
         if path in self.images:
@@ -557,6 +644,36 @@ class LabelProject:
                 result.append((image, label))
         return result
 
+    def as_arrays(self, labels: Optional[list[tuple[ImageData, PointLabel]]] = None
+                  ) -> dict[str, np.ndarray]:
+        """Return labels as parallel (structure-of-arrays) NumPy columns.
+
+        Args:
+            labels: Optional ``get_all_labels()`` result to convert, so callers
+                that also need the (image, label) pairs build them only once.
+
+        Returns:
+            Dict with ``id`` (int64), ``lon``, ``lat``, ``pixel_x``,
+            ``pixel_y`` (float64) and ``class_idx`` (int32 index into
+            ``classes``; -1 for unknown classes), in ``get_all_labels`` order.
+        """
+        if labels is None:
+            labels = self.get_all_labels()
+        class_index = {name: i for i, name in enumerate(self.classes)}
+        count = len(labels)
+        return {
+            'id': np.fromiter((l.id for _, l in labels), np.int64, count),
+            'lon': np.fromiter((l.lon for _, l in labels), np.float64, count),
+            'lat': np.fromiter((l.lat for _, l in labels), np.float64, count),
+            'pixel_x': np.fromiter(
+                (l.pixel_x for _, l in labels), np.float64, count),
+            'pixel_y': np.fromiter(
+                (l.pixel_y for _, l in labels), np.float64, count),
+            'class_idx': np.fromiter(
+                (class_index.get(l.class_name, -1) for _, l in labels),
+                np.int32, count),
+        }
+
     def get_labels_for_image(self, image_path: str) -> list[PointLabel]:
         """Get all labels for a specific image."""
         if image_path in self.images:
@@ -664,27 +781,52 @@ class LabelProject:
 
         return result
 
+    def get_object_groups(self) -> dict[str, list[int]]:
+        """Get the label IDs sharing each object_id, from the index.
+
+        Lets callers derive linked status for every label in one pass instead
+        of calling ``get_linked_labels`` per label.
+        """
+        return {object_id: list(label_ids)
+                for object_id, label_ids in self._object_id_index.items()}
+
+    def count_labels_in_classes(self, class_names) -> int:
+        """Get the number of labels belonging to any of the given classes."""
+        return sum(len(self._class_index.get(name, ()))
+                   for name in class_names)
+
     @property
     def label_count(self) -> int:
-        """Get total number of labels across all images."""
-        return sum(len(img.labels) for img in self.images.values())
+        """Get total number of labels across all images.
 
-    def save(self, file_path: str | Path):
-        """Save project to JSON file."""
-        data = {
+        Read from the label id index (every label is indexed when added or
+        loaded), so this is O(1) rather than a walk over all images.
+        """
+        return len(self._label_id_index)
+
+    def to_dict(self) -> dict:
+        """Convert to a project-file dictionary.
+
+        The result shares no mutable state with the project, so it can be
+        serialized on another thread while labelling continues.
+        """
+        return {
             "version": "3.2",
-            "classes": self.classes,
+            "classes": list(self.classes),
             "images": [img.to_dict() for img in self.images.values()],
             "_next_id": self._next_id
         }
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+
+    def save(self, file_path: str | Path):
+        """Save project to JSON file."""
+        write_project_json(self.to_dict(), file_path)
 
     @classmethod
     def load(cls, file_path: str | Path) -> "LabelProject":
         """Load project from JSON file."""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        # Read bytes so UTF-8 files load regardless of the locale encoding
+        with open(file_path, 'rb') as f:
+            data = json.loads(f.read())
 
         project = cls()
         project.classes = data.get("classes", [])
@@ -743,6 +885,7 @@ class LabelProject:
         self._next_id = 1
         self._object_id_index.clear()
         self._label_id_index.clear()
+        self._class_index.clear()
 
     def clear_all(self):
         """Clear everything."""
@@ -751,3 +894,4 @@ class LabelProject:
         self._next_id = 1
         self._object_id_index.clear()
         self._label_id_index.clear()
+        self._class_index.clear()
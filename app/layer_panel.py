@@ -1,11 +1,13 @@
 """Layer panel for managing loaded layers and groups."""
 import os
+from collections import defaultdict
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem,
     QMenu, QInputDialog, QMessageBox, QStyle, QApplication,
     QLabel, QSplitter
 )
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal, QSignalBlocker
 from PyQt5.QtGui import QColor
 
 
@@ -43,6 +45,7 @@ class LayerPanel(QWidget):
         """Initialize the layer panel and its lookup caches."""
         super().__init__()
         self._batch_mode = False  # When True, suppress signals during batch operations
+        self._batch_sorting = False  # Sorting state to restore after a batch
         self._nongeo_root = None  # Top-level node for non-georeferenced images
         # O(1) lookup caches keyed by layer id and by file path. Maintained
         # in add_layer / add_nongeo_layer / _remove_item / clear. Drag-drop
@@ -80,6 +83,8 @@ class LayerPanel(QWidget):
         Call this before adding many items, then call end_batch_update() when done.
         """
         self._batch_mode = True
+        self._batch_sorting = self.tree.isSortingEnabled()
+        self.tree.setSortingEnabled(False)
         self.tree.setUpdatesEnabled(False)
         self.tree.blockSignals(True)
 
@@ -87,8 +92,9 @@ class LayerPanel(QWidget):
         """End a batch update - re-enables signals and refreshes the tree."""
         self._batch_mode = False
         self.tree.blockSignals(False)
+        self.tree.setSortingEnabled(self._batch_sorting)
         self.tree.setUpdatesEnabled(True)
-        self.tree.update()
+        self.tree.viewport().update()
 
     def add_layer(self, layer_id: str, file_path: str,
                   parent: QTreeWidgetItem = None, visible: bool = True):
@@ -100,6 +106,37 @@ class LayerPanel(QWidget):
             parent: Optional parent group item. If None, adds to top level.
             visible: Whether the layer should be visible (checked) initially.
         """
+        item = self._make_layer_item(layer_id, file_path, visible)
+        if parent:
+            parent.addChild(item)
+        else:
+            self.tree.addTopLevelItem(item)
+
+    def add_layers(self, layers: list[tuple[str, str]],
+                   parent: QTreeWidgetItem = None, visible: bool = True):
+        """Add several layer items under one parent in a single insert.
+
+        All items are built first and inserted with one addChildren /
+        addTopLevelItems call, so the tree model emits one rows-inserted
+        notification for the whole list instead of one per layer.
+
+        Args:
+            layers: List of (layer_id, file_path) tuples, in display order
+            parent: Optional parent group item. If None, adds to top level.
+            visible: Whether the layers should be visible (checked) initially.
+        """
+        items = [self._make_layer_item(layer_id, file_path, visible)
+                 for layer_id, file_path in layers]
+        if not items:
+            return
+        if parent:
+            parent.addChildren(items)
+        else:
+            self.tree.addTopLevelItems(items)
+
+    def _make_layer_item(self, layer_id: str, file_path: str,
+                         visible: bool) -> QTreeWidgetItem:
+        """Create a layer item and register it in the lookup caches."""
         item = QTreeWidgetItem()
         item.setText(0, os.path.basename(file_path))
         item.setData(0, Qt.UserRole, layer_id)
@@ -112,14 +149,10 @@ class LayerPanel(QWidget):
         style = QApplication.style()
         item.setIcon(0, style.standardIcon(QStyle.SP_FileIcon))
 
-        if parent:
-            parent.addChild(item)
-        else:
-            self.tree.addTopLevelItem(item)
-
         # Register in O(1) lookup caches
         self._layer_items[layer_id] = item
         self._path_items[file_path] = item
+        return item
 
     def add_group(self, name: str, parent: QTreeWidgetItem = None,
                   visible: bool = True):
@@ -187,21 +220,18 @@ class LayerPanel(QWidget):
         Args:
             item: The item whose parents should be checked
         """
-        self.tree.blockSignals(True)
-        parent = item.parent()
-        while parent is not None:
-            if parent.checkState(0) != Qt.Checked:
-                parent.setCheckState(0, Qt.Checked)
-            parent = parent.parent()
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            parent = item.parent()
+            while parent is not None:
+                if parent.checkState(0) != Qt.Checked:
+                    parent.setCheckState(0, Qt.Checked)
+                parent = parent.parent()
 
     def _check_parents_of_visible_items(self):
         """Ensure all parent groups are checked for any checked (visible) items.
 
         Called after drag-drop to fix parent states when items are moved.
         """
-        self.tree.blockSignals(True)
-
         def check_item(item: QTreeWidgetItem):
             """Recursively ensure parents of any checked item are also checked."""
             item_type = item.data(0, Qt.UserRole + 1)
@@ -228,10 +258,9 @@ class LayerPanel(QWidget):
                     check_item(item.child(i))
 
         # Check all top-level items
-        for i in range(self.tree.topLevelItemCount()):
-            check_item(self.tree.topLevelItem(i))
-
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            for i in range(self.tree.topLevelItemCount()):
+                check_item(self.tree.topLevelItem(i))
 
     def _count_descendant_layers(self, item: QTreeWidgetItem) -> int:
         """Count all layer items that are descendants of this item."""
@@ -550,16 +579,15 @@ class LayerPanel(QWidget):
         changed_layers = []
 
         # Block signals to prevent cascading _on_item_changed calls
-        self.tree.blockSignals(True)
-        for i, layer_id in enumerate(layer_ids, start=1):
-            item = self._layer_items.get(layer_id)
-            if item is not None and item.checkState(0) == Qt.Checked:
-                item.setCheckState(0, Qt.Unchecked)
-                changed_layers.append(layer_id)
-            self.batch_visibility_progress.emit(i)
-            if i % 50 == 0:
-                QApplication.processEvents()
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            for i, layer_id in enumerate(layer_ids, start=1):
+                item = self._layer_items.get(layer_id)
+                if item is not None and item.checkState(0) == Qt.Checked:
+                    item.setCheckState(0, Qt.Unchecked)
+                    changed_layers.append(layer_id)
+                self.batch_visibility_progress.emit(i)
+                if i % 50 == 0:
+                    QApplication.processEvents()
 
         # Emit visibility changed signals for each layer that was actually
         # changed
@@ -582,16 +610,15 @@ class LayerPanel(QWidget):
         changed_layers = []
 
         # Block signals to prevent cascading _on_item_changed calls
-        self.tree.blockSignals(True)
-        for i, layer_id in enumerate(layer_ids, start=1):
-            item = self._layer_items.get(layer_id)
-            if item is not None and item.checkState(0) == Qt.Unchecked:
-                item.setCheckState(0, Qt.Checked)
-                changed_layers.append(layer_id)
-            self.batch_visibility_progress.emit(i)
-            if i % 50 == 0:
-                QApplication.processEvents()
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            for i, layer_id in enumerate(layer_ids, start=1):
+                item = self._layer_items.get(layer_id)
+                if item is not None and item.checkState(0) == Qt.Unchecked:
+                    item.setCheckState(0, Qt.Checked)
+                    changed_layers.append(layer_id)
+                self.batch_visibility_progress.emit(i)
+                if i % 50 == 0:
+                    QApplication.processEvents()
 
         # Emit visibility changed signals for each layer that was actually
         # changed
@@ -770,23 +797,19 @@ class LayerPanel(QWidget):
         Same as add_layer but defaults to the non-geo root if no parent given.
         """
         nongeo_parent = parent or self.get_or_create_nongeo_root()
+        nongeo_parent.addChild(
+            self._make_layer_item(layer_id, file_path, visible))
 
-        item = QTreeWidgetItem()
-        item.setText(0, os.path.basename(file_path))
-        item.setData(0, Qt.UserRole, layer_id)
-        item.setData(0, Qt.UserRole + 1, "layer")
-        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-        item.setCheckState(0, Qt.Checked if visible else Qt.Unchecked)
-        item.setToolTip(0, file_path)
-
-        style = QApplication.style()
-        item.setIcon(0, style.standardIcon(QStyle.SP_FileIcon))
-
-        nongeo_parent.addChild(item)
+    def add_nongeo_layers(self, layers: list[tuple[str, str]],
+                          parent: QTreeWidgetItem = None,
+                          visible: bool = True):
+        """Add several layers to the Non-Georeferenced section in one insert.
 
-        # Register in O(1) lookup caches
-        self._layer_items[layer_id] = item
-        self._path_items[file_path] = item
+        Same as add_layers but defaults to the non-geo root if no parent given.
+        """
+        if layers:
+            self.add_layers(
+                layers, parent or self.get_or_create_nongeo_root(), visible)
 
     def set_layer_checked(self, layer_id: str, checked: bool):
         """Set the check state of a specific layer without emitting signals.
@@ -799,18 +822,16 @@ class LayerPanel(QWidget):
         if found_item is None:
             return
 
-        self.tree.blockSignals(True)
-        found_item.setCheckState(0, Qt.Checked if checked else Qt.Unchecked)
+        with QSignalBlocker(self.tree):
+            found_item.setCheckState(0, Qt.Checked if checked else Qt.Unchecked)
 
-        # If turning ON, also check all parent groups
-        if checked:
-            parent = found_item.parent()
-            while parent is not None:
-                if parent.checkState(0) != Qt.Checked:
-                    parent.setCheckState(0, Qt.Checked)
-                parent = parent.parent()
-
-        self.tree.blockSignals(False)
+            # If turning ON, also check all parent groups
+            if checked:
+                parent = found_item.parent()
+                while parent is not None:
+                    if parent.checkState(0) != Qt.Checked:
+                        parent.setCheckState(0, Qt.Checked)
+                    parent = parent.parent()
 
     def is_layer_checked(self, layer_id: str) -> bool:
         """Check if a specific layer is checked (visible).
@@ -863,11 +884,25 @@ class LabeledLayerPanel(QWidget):
     # lon, lat - zoom to specific coordinates
     zoom_to_label_requested = pyqtSignal(float, float)
 
+    # Group header colors: steel blue for linked objects, cornflower blue for
+    # single labels
+    LINKED_GROUP_COLOR = QColor(70, 130, 180)
+    SINGLE_GROUP_COLOR = QColor(100, 149, 237)
+
     def __init__(self):
         """Initialize the labeled-layer panel and its file-to-layer map."""
         super().__init__()
         # file_path -> layer_id (from main panel)
         self._layer_id_map: dict[str, str] = {}
+        # object_id -> group item, label_id -> label item, so refresh can
+        # update existing rows in place
+        self._group_items: dict[str, QTreeWidgetItem] = {}
+        self._label_items: dict[int, QTreeWidgetItem] = {}
+        # Refresh generation counter and the generation each item was last
+        # seen in; items with an older generation are removed
+        self._gen = 0
+        self._group_gen: dict[str, int] = {}
+        self._label_gen: dict[int, int] = {}
         self._setup_ui()
 
     def _setup_ui(self):
@@ -914,6 +949,72 @@ class LabeledLayerPanel(QWidget):
         width_s = f"{width_m:.1f}" if width_m is not None else "?"
         return f"  •  {length_s}×{width_s} m"
 
+    def _make_group_item(self, object_id: str) -> QTreeWidgetItem:
+        """Create, register and add the top-level item for an object group.
+
+        Text, color and check state are set by the caller.
+        """
+        group_item = QTreeWidgetItem()
+        group_item.setData(0, Qt.UserRole, object_id)
+        group_item.setData(0, Qt.UserRole + 1, "group")
+        group_item.setFlags(group_item.flags() | Qt.ItemIsUserCheckable)
+        group_item.setIcon(
+            0, QApplication.style().standardIcon(QStyle.SP_DirIcon))
+
+        # Bold font for groups
+        font = group_item.font(0)
+        font.setBold(True)
+        group_item.setFont(0, font)
+
+        self.tree.addTopLevelItem(group_item)
+        group_item.setExpanded(True)
+        self._group_items[object_id] = group_item
+        self._group_gen[object_id] = self._gen
+        return group_item
+
+    def _set_group_count(self, group_item: QTreeWidgetItem, count: int):
+        """Update a group's label count text and its link-status color."""
+        object_id = group_item.data(0, Qt.UserRole)
+        short_id = object_id[:8] + "..."  # Truncate UUID for display
+        group_item.setText(0, f"Object: {short_id} ({count})")
+        group_item.setForeground(
+            0, self.LINKED_GROUP_COLOR if count > 1
+            else self.SINGLE_GROUP_COLOR)
+
+    def _make_label_item(self, label_id: int,
+                         group_item: QTreeWidgetItem) -> QTreeWidgetItem:
+        """Create and register a label item under ``group_item``.
+
+        Text, position data and check state are set by ``_set_label_data``.
+        """
+        label_item = QTreeWidgetItem()
+        label_item.setData(0, Qt.UserRole + 1, "label")
+        label_item.setData(0, Qt.UserRole + 2, label_id)
+        label_item.setFlags(label_item.flags() | Qt.ItemIsUserCheckable)
+        label_item.setIcon(
+            0, QApplication.style().standardIcon(QStyle.SP_FileIcon))
+        group_item.addChild(label_item)
+        self._label_items[label_id] = label_item
+        self._label_gen[label_id] = self._gen
+        return label_item
+
+    def _set_label_data(self, label_item: QTreeWidgetItem, label_id: int,
+                        image_name: str, file_path: str, lon: float,
+                        lat: float, class_name: str, length_m, width_m,
+                        is_visible: bool):
+        """Write a label's text, tooltip, coordinates and check state."""
+        label_item.setText(
+            0, f"#{label_id}: {image_name} [{class_name}]"
+               + self._measurement_suffix(length_m, width_m))
+        label_item.setData(0, Qt.UserRole, file_path)
+        label_item.setData(0, Qt.UserRole + 3, lon)
+        label_item.setData(0, Qt.UserRole + 4, lat)
+        label_item.setCheckState(
+            0, Qt.Checked if is_visible else Qt.Unchecked)
+        label_item.setToolTip(
+            0, f"Label #{label_id} on {file_path}\n"
+               f"Lon: {lon:.6f}, Lat: {lat:.6f}")
+
     def refresh(self, project, visibility_checker=None):
         """Refresh the tree with current labels from the project.
 
@@ -921,103 +1022,87 @@ class LabeledLayerPanel(QWidget):
             project: The LabelProject containing images and labels
             visibility_checker: Optional callable(file_path) -> bool to check layer visibility
         """
-        self.tree.blockSignals(True)
-        self.tree.clear()
-
-        # Group labels by object_id
-        # object_id -> list of (label_id, image_name, image_path, lon, lat,
-        # class_name)
-        object_groups: dict[str,
-                            list[tuple[int, str, str, float, float, str]]] = {}
-
-        for image in project.images.values():
-            if not image.labels:
-                continue
-
-            for label in image.labels:
-                object_id = label.object_id
-                if object_id not in object_groups:
-                    object_groups[object_id] = []
-
-                object_groups[object_id].append((
-                    label.id,
-                    image.name,
-                    image.path,
-                    label.lon,
-                    label.lat,
-                    label.class_name,
-                    label.length_m,
-                    label.width_m
-                ))
-
-        # Create tree items
-        style = QApplication.style()
-
-        for object_id, labels in object_groups.items():
-            # Create group for this object_id
-            group_item = QTreeWidgetItem()
-            short_id = object_id[:8] + "..."  # Truncate UUID for display
-            label_count = len(labels)
-            group_item.setText(0, f"Object: {short_id} ({label_count})")
-            group_item.setData(0, Qt.UserRole, object_id)
-            group_item.setData(0, Qt.UserRole + 1, "group")
-            group_item.setFlags(group_item.flags() | Qt.ItemIsUserCheckable)
-            # Check state will be set after children are added based on their
-            # visibility
-            group_item.setIcon(0, style.standardIcon(QStyle.SP_DirIcon))
-
-            # Bold font for groups, different colors based on link status
-            font = group_item.font(0)
-            font.setBold(True)
-            group_item.setFont(0, font)
-            if label_count > 1:
-                # Steel blue for linked
-                group_item.setForeground(0, QColor(70, 130, 180))
-            else:
-                # Cornflower blue for single
-                group_item.setForeground(0, QColor(100, 149, 237))
-
-            self.tree.addTopLevelItem(group_item)
-
-            # Add each label as a child
-            any_visible = False
-            for (label_id, image_name, file_path, lon, lat, class_name,
-                 length_m, width_m) in labels:
-                label_item = QTreeWidgetItem()
-                label_item.setText(
-                    0, f"#{label_id}: {image_name} [{class_name}]"
-                       + self._measurement_suffix(length_m, width_m))
-                label_item.setData(0, Qt.UserRole, file_path)
-                label_item.setData(0, Qt.UserRole + 1, "label")
-                label_item.setData(0, Qt.UserRole + 2, label_id)
-                label_item.setData(0, Qt.UserRole + 3, lon)
-                label_item.setData(0, Qt.UserRole + 4, lat)
-                label_item.setFlags(
-                    label_item.flags() | Qt.ItemIsUserCheckable)
-
-                # Check visibility - default to unchecked if no checker
-                # provided
-                is_visible = visibility_checker(
-                    file_path) if visibility_checker else False
-                label_item.setCheckState(
-                    0, Qt.Checked if is_visible else Qt.Unchecked)
-                if is_visible:
-                    any_visible = True
-
-                label_item.setToolTip(
-                    0, f"Label #{label_id} on {file_path}\nLon: {
-                        lon:.6f}, Lat: {
-                        lat:.6f}")
-                label_item.setIcon(0, style.standardIcon(QStyle.SP_FileIcon))
-                group_item.addChild(label_item)
-
-            # Set group check state based on children
-            group_item.setCheckState(
-                0, Qt.Checked if any_visible else Qt.Unchecked)
-
-            group_item.setExpanded(True)
-
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            # Each refresh gets a new generation; items not touched by it are
+            # stale and get swept at the end instead of rebuilding the whole tree.
+            self._gen += 1
+            gen = self._gen
+
+            # Group labels by object_id in a single pass. Layer visibility is
+            # resolved once per image rather than once per label.
+            # object_id -> list of (label_id, image_name, image_path, lon, lat,
+            # class_name, length_m, width_m, is_visible)
+            object_groups: dict[str, list[tuple]] = defaultdict(list)
+
+            for image in project.images.values():
+                if not image.labels:
+                    continue
+
+                # Default to unchecked if no checker provided
+                is_visible = bool(visibility_checker(
+                    image.path)) if visibility_checker else False
+                name = image.name
+                path = image.path
+                for label in image.labels:
+                    object_groups[label.object_id].append((
+                        label.id,
+                        name,
+                        path,
+                        label.lon,
+                        label.lat,
+                        label.class_name,
+                        label.length_m,
+                        label.width_m,
+                        is_visible
+                    ))
+
+            # Create or update tree items
+            for object_id, labels in object_groups.items():
+                group_item = self._group_items.get(object_id)
+                if group_item is None:
+                    group_item = self._make_group_item(object_id)
+                self._group_gen[object_id] = gen
+                self._set_group_count(group_item, len(labels))
+
+                # Add or update each label as a child
+                any_visible = False
+                for entry in labels:
+                    label_id = entry[0]
+                    label_item = self._label_items.get(label_id)
+                    if label_item is None:
+                        label_item = self._make_label_item(
+                            label_id, group_item)
+                    elif label_item.parent() is not group_item:
+                        # Label was linked into a different object group
+                        old_parent = label_item.parent()
+                        if old_parent is not None:
+                            old_parent.removeChild(label_item)
+                        group_item.addChild(label_item)
+                    self._label_gen[label_id] = gen
+
+                    self._set_label_data(label_item, *entry)
+                    if entry[-1]:
+                        any_visible = True
+
+                # Set group check state based on children
+                group_item.setCheckState(
+                    0, Qt.Checked if any_visible else Qt.Unchecked)
+
+            # Sweep items that were not touched by this generation
+            for label_id in [lid for lid, g in self._label_gen.items()
+                             if g != gen]:
+                label_item = self._label_items.pop(label_id)
+                del self._label_gen[label_id]
+                parent = label_item.parent()
+                if parent is not None:
+                    parent.removeChild(label_item)
+            for object_id in [oid for oid, g in self._group_gen.items()
+                              if g != gen]:
+                group_item = self._group_items.pop(object_id)
+                del self._group_gen[object_id]
+                index = self.tree.indexOfTopLevelItem(group_item)
+                if index >= 0:
+                    self.tree.takeTopLevelItem(index)
 
     def add_label(self, label, image, visibility_checker=None):
         """Add a single label to the tree incrementally (O(1) instead of full refresh).
@@ -1027,73 +1112,29 @@ class LabeledLayerPanel(QWidget):
             image: The ImageData the label belongs to
             visibility_checker: Optional callable(file_path) -> bool to check layer visibility
         """
-        self.tree.blockSignals(True)
-        style = QApplication.style()
+        with QSignalBlocker(self.tree):
+            object_id = label.object_id
 
-        object_id = label.object_id
-
-        # Find existing group for this object_id
-        group_item = None
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            if item.data(0, Qt.UserRole) == object_id:
-                group_item = item
-                break
-
-        # Create new group if needed
-        if group_item is None:
-            group_item = QTreeWidgetItem()
-            short_id = object_id[:8] + "..."  # Truncate UUID for display
-            group_item.setText(0, f"Object: {short_id} (1)")
-            group_item.setData(0, Qt.UserRole, object_id)
-            group_item.setData(0, Qt.UserRole + 1, "group")
-            group_item.setFlags(group_item.flags() | Qt.ItemIsUserCheckable)
-            group_item.setIcon(0, style.standardIcon(QStyle.SP_DirIcon))
-
-            font = group_item.font(0)
-            font.setBold(True)
-            group_item.setFont(0, font)
-            # Cornflower blue for single label
-            group_item.setForeground(0, QColor(100, 149, 237))
-            group_item.setCheckState(0, Qt.Unchecked)
-            group_item.setExpanded(True)
-
-            self.tree.addTopLevelItem(group_item)
-        else:
-            # Update group label count and color
-            new_count = group_item.childCount() + 1
-            short_id = object_id[:8] + "..."
-            group_item.setText(0, f"Object: {short_id} ({new_count})")
-            if new_count > 1:
-                # Steel blue for linked
-                group_item.setForeground(0, QColor(70, 130, 180))
-
-        # Create label item
-        label_item = QTreeWidgetItem()
-        label_item.setText(
-            0, f"#{label.id}: {image.name} [{label.class_name}]"
-               + self._measurement_suffix(label.length_m, label.width_m))
-        label_item.setData(0, Qt.UserRole, image.path)
-        label_item.setData(0, Qt.UserRole + 1, "label")
-        label_item.setData(0, Qt.UserRole + 2, label.id)
-        label_item.setData(0, Qt.UserRole + 3, label.lon)
-        label_item.setData(0, Qt.UserRole + 4, label.lat)
-        label_item.setFlags(label_item.flags() | Qt.ItemIsUserCheckable)
+            # Find existing group for this object_id, or create it
+            group_item = self._group_items.get(object_id)
+            if group_item is None:
+                group_item = self._make_group_item(object_id)
+                group_item.setCheckState(0, Qt.Unchecked)
 
-        # Check visibility
-        is_visible = visibility_checker(image.path) if visibility_checker else False
-        label_item.setCheckState(0, Qt.Checked if is_visible else Qt.Unchecked)
+            label_item = self._make_label_item(label.id, group_item)
+            self._set_group_count(group_item, group_item.childCount())
 
-        label_item.setToolTip(
-            0, f"Label #{label.id} on {image.path}\nLon: {label.lon:.6f}, Lat: {label.lat:.6f}")
-        label_item.setIcon(0, style.standardIcon(QStyle.SP_FileIcon))
-        group_item.addChild(label_item)
+            # Check visibility
+            is_visible = bool(visibility_checker(
+                image.path)) if visibility_checker else False
+            self._set_label_data(
+                label_item, label.id, image.name, image.path, label.lon,
+                label.lat, label.class_name, label.length_m, label.width_m,
+                is_visible)
 
-        # Update group check state if this label is visible
-        if is_visible and group_item.checkState(0) != Qt.Checked:
-            group_item.setCheckState(0, Qt.Checked)
-
-        self.tree.blockSignals(False)
+            # Update group check state if this label is visible
+            if is_visible and group_item.checkState(0) != Qt.Checked:
+                group_item.setCheckState(0, Qt.Checked)
 
     def remove_label(self, label_id: int):
         """Remove a single label from the tree incrementally.
@@ -1101,33 +1142,28 @@ class LabeledLayerPanel(QWidget):
         Args:
             label_id: The ID of the label to remove
         """
-        self.tree.blockSignals(True)
-
-        # Find and remove the label item
-        for i in range(self.tree.topLevelItemCount()):
-            group_item = self.tree.topLevelItem(i)
-            for j in range(group_item.childCount()):
-                child = group_item.child(j)
-                if child.data(0, Qt.UserRole + 2) == label_id:
-                    group_item.removeChild(child)
-
-                    # Update or remove the group
-                    remaining = group_item.childCount()
-                    if remaining == 0:
-                        self.tree.takeTopLevelItem(i)
-                    else:
-                        # Update label count and color
-                        object_id = group_item.data(0, Qt.UserRole)
-                        short_id = object_id[:8] + "..."
-                        group_item.setText(0, f"Object: {short_id} ({remaining})")
-                        if remaining == 1:
-                            # Back to cornflower blue for single
-                            group_item.setForeground(0, QColor(100, 149, 237))
-
-                    self.tree.blockSignals(False)
-                    return
+        child = self._label_items.pop(label_id, None)
+        self._label_gen.pop(label_id, None)
+        if child is None:
+            return
+        group_item = child.parent()
+        if group_item is None:
+            return
 
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            group_item.removeChild(child)
+
+            # Update or remove the group
+            object_id = group_item.data(0, Qt.UserRole)
+            remaining = group_item.childCount()
+            if remaining == 0:
+                self.tree.takeTopLevelItem(
+                    self.tree.indexOfTopLevelItem(group_item))
+                self._group_items.pop(object_id, None)
+                self._group_gen.pop(object_id, None)
+            else:
+                # Update label count and color
+                self._set_group_count(group_item, remaining)
 
     def _on_item_changed(self, item: QTreeWidgetItem, column: int):
         """Handle item check state changes."""
@@ -1144,22 +1180,20 @@ class LabeledLayerPanel(QWidget):
             if checked:
                 parent = item.parent()
                 if parent is not None and parent.checkState(0) != Qt.Checked:
-                    self.tree.blockSignals(True)
-                    parent.setCheckState(0, Qt.Checked)
-                    self.tree.blockSignals(False)
+                    with QSignalBlocker(self.tree):
+                        parent.setCheckState(0, Qt.Checked)
 
         elif item_type == "group":
             # Toggle all children
-            self.tree.blockSignals(True)
-            for i in range(item.childCount()):
-                child = item.child(i)
-                child.setCheckState(0, item.checkState(0))
-                # Also emit visibility change for each child
-                file_path = child.data(0, Qt.UserRole)
-                layer_id = self._layer_id_map.get(file_path)
-                if layer_id:
-                    self.layer_visibility_changed.emit(layer_id, checked)
-            self.tree.blockSignals(False)
+            with QSignalBlocker(self.tree):
+                for i in range(item.childCount()):
+                    child = item.child(i)
+                    child.setCheckState(0, item.checkState(0))
+                    # Also emit visibility change for each child
+                    file_path = child.data(0, Qt.UserRole)
+                    layer_id = self._layer_id_map.get(file_path)
+                    if layer_id:
+                        self.layer_visibility_changed.emit(layer_id, checked)
 
     def _show_context_menu(self, position):
         """Show right-click context menu."""
@@ -1223,8 +1257,6 @@ class LabeledLayerPanel(QWidget):
             file_path: The file path of the layer
             checked: True to check, False to uncheck
         """
-        self.tree.blockSignals(True)
-
         def find_and_set(parent=None):
             """Recursively set the check state of label items matching ``file_path``."""
             if parent is None:
@@ -1247,8 +1279,8 @@ class LabeledLayerPanel(QWidget):
                     for i in range(parent.childCount()):
                         find_and_set(parent.child(i))
 
-        find_and_set()
-        self.tree.blockSignals(False)
+        with QSignalBlocker(self.tree):
+            find_and_set()
 
     def toggle_layer_checked(self, file_path: str):
         """Toggle the check state of labels for a file path.
@@ -1266,11 +1298,10 @@ class LabeledLayerPanel(QWidget):
                 item_type = parent.data(0, Qt.UserRole + 1)
                 if item_type == "label":
                     if parent.data(0, Qt.UserRole) == file_path:
-                        self.tree.blockSignals(True)
-                        current_state = parent.checkState(0)
-                        new_state = Qt.Unchecked if current_state == Qt.Checked else Qt.Checked
-                        parent.setCheckState(0, new_state)
-                        self.tree.blockSignals(False)
+                        with QSignalBlocker(self.tree):
+                            current_state = parent.checkState(0)
+                            new_state = Qt.Unchecked if current_state == Qt.Checked else Qt.Checked
+                            parent.setCheckState(0, new_state)
                 elif item_type == "group":
                     for i in range(parent.childCount()):
                         find_and_toggle(parent.child(i))
@@ -1281,6 +1312,10 @@ class LabeledLayerPanel(QWidget):
         """Clear all items from the tree and internal state."""
         self.tree.clear()
         self._layer_id_map.clear()
+        self._group_items.clear()
+        self._label_items.clear()
+        self._group_gen.clear()
+        self._label_gen.clear()
 
 
 class CombinedLayerPanel(QWidget):
@@ -1421,6 +1456,19 @@ class CombinedLayerPanel(QWidget):
         # Register mapping in labeled panel
         self.labeled_panel.set_layer_id_map(file_path, layer_id)
 
+    def add_layers(self, layers: list[tuple[str, str]],
+                   parent: QTreeWidgetItem = None, visible: bool = True):
+        """Add several layers under one parent in a single tree insert.
+
+        Args:
+            layers: List of (layer_id, file_path) tuples, in display order
+            parent: Optional parent group item
+            visible: Whether the layers should be visible (checked) initially
+        """
+        self.main_panel.add_layers(layers, parent, visible)
+        for layer_id, file_path in layers:
+            self.labeled_panel.set_layer_id_map(file_path, layer_id)
+
     def add_group(self, name: str, parent: QTreeWidgetItem = None,
                   visible: bool = True):
         """Add a group to the main tree.
@@ -1490,6 +1538,13 @@ class CombinedLayerPanel(QWidget):
         self.main_panel.add_nongeo_layer(layer_id, file_path, parent, visible)
         self.labeled_panel.set_layer_id_map(file_path, layer_id)
 
+    def add_nongeo_layers(self, layers: list[tuple[str, str]], parent=None,
+                          visible: bool = True):
+        """Add several layers to the Non-Georeferenced section in one insert."""
+        self.main_panel.add_nongeo_layers(layers, parent, visible)
+        for layer_id, file_path in layers:
+            self.labeled_panel.set_layer_id_map(file_path, layer_id)
+
     def clear(self):
         """Clear all items from both trees."""
         self.main_panel.clear()
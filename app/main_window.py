@@ -5,15 +5,17 @@ import os
 import platform
 import tempfile
 import threading
+import time
 import traceback
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
 
 import numpy as np
 import rasterio
-from pyproj import Transformer
 from PyQt5.QtCore import Qt, Qt as QtCore_Qt, QTimer, QEvent, QThread, QObject, pyqtSignal
-from PyQt5.QtGui import QColor, QKeyEvent
+from PyQt5.QtGui import QColor, QKeyEvent, QKeySequence
 from PyQt5.QtWidgets import (
     QMainWindow,
     QSplitter,
@@ -27,19 +29,30 @@ from PyQt5.QtWidgets import (
     QProgressDialog,
     QApplication,
     QProgressBar,
+    QToolButton,
     QInputDialog)
 
 from .axis_ruler import MapCanvasWithAxes
 from .canvas import (MapCanvas, CanvasMode, CYCLE_MODES,
                      AsyncFileLoaderThread, TiledLayer)
 from .class_editor import ClassEditorDialog
-from .labels import LabelProject, ImageData, haversine_distance
+from .labels import LabelProject, write_project_json
 from .layer_panel import CombinedLayerPanel
-from .optimize_export import OptimizeExportDialog, OptimizeWorker, plan_output_path
+from .optimize_export import (OptimizeExportDialog, OptimizeWorker,
+                              OverviewBuildWorker, plan_output_path)
 from .mosaic_export import MosaicExportDialog, MosaicWorker
+from .subimage_export import (SubimageExportWorker,
+                              COMPRESSION_CHOICES as SUBIMAGE_COMPRESSION)
 from .debug_log import debug, debug_log, DebugConsole
 
 
+# File dialog hints for image folders (often large or on network mounts):
+# skip custom per-directory icon lookups and symlink resolution, both of
+# which stat every entry while the listing is shown.
+IMAGE_DIALOG_OPTIONS = (QFileDialog.DontUseCustomDirectoryIcons
+                        | QFileDialog.DontResolveSymlinks)
+
+
 class GroupMemoryWorker(QObject):
     """Worker that reprojects layer pixel data off the UI thread for preloading.
 
@@ -106,6 +119,211 @@ class GroupMemoryWorker(QObject):
         self.finished.emit()
 
 
+# File extensions picked up by Add Directory (compared lower-cased).
+IMAGE_EXTENSIONS = (".tif", ".tiff")
+
+# Minimum seconds between progress-dialog refreshes during a sync import
+SYNC_IMPORT_UI_INTERVAL_S = 0.05
+
+# Async-loaded files added to the canvas/tree per UI timer tick. Headers are
+# already read off-thread, so each file is cheap here; tree and canvas
+# updates are batched per tick.
+ASYNC_UI_BATCH_SIZE = 32
+
+
+def _sorted_dir_entries(directory: str) -> list:
+    """Return a directory's entries sorted case-insensitively ([] on error)."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda e: (e.name.lower(), e.name))
+    except OSError:
+        return []
+
+
+def _iter_image_files(root: str):
+    """Yield image file paths under ``root`` in sorted path order.
+
+    Uses a single ``os.scandir`` walk driven by an explicit stack (no nested
+    generators, so yielding a file costs the same at any depth), filtering
+    extensions in the same loop and relying on the directory entry's cached
+    type instead of a ``stat`` per file. Entries are sorted per directory on
+    their lower-cased name (computed once per entry), so the order is
+    case-insensitive and the same on every platform. Each entry is visited
+    once, so no dedupe pass is needed.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Path string of each .tif/.tiff file
+    """
+    stack = [iter(_sorted_dir_entries(root))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(iter(_sorted_dir_entries(entry.path)))
+            elif (entry.is_file()
+                  and entry.name.lower().endswith(IMAGE_EXTENSIONS)):
+                yield entry.path
+        except OSError:
+            continue
+
+
+def _relative_dirs(root_path: Path, file_paths: list[str]) -> list[str]:
+    """Return each file's directory relative to ``root_path``.
+
+    Results are '/'-separated ("" for files directly in the root). The
+    relative path is computed once per distinct parent directory, since
+    sorted scan results list a directory's files together.
+
+    Args:
+        root_path: Directory the files were found under
+        file_paths: File path strings under ``root_path``
+    """
+    by_dir: dict[str, str] = {}
+    rel_dirs = []
+    for file_path in file_paths:
+        parent = os.path.dirname(file_path)
+        rel_dir = by_dir.get(parent)
+        if rel_dir is None:
+            rel_dir = Path(parent).relative_to(root_path).as_posix()
+            if rel_dir == ".":
+                rel_dir = ""
+            by_dir[parent] = rel_dir
+        rel_dirs.append(rel_dir)
+    return rel_dirs
+
+
+def _existing_paths(paths) -> set[str]:
+    """Return the subset of ``paths`` that exist as files.
+
+    Lists each distinct parent directory once with ``os.scandir`` instead of
+    stat-ing every path, which matters on network drives where each stat is
+    a round trip. Names are compared with ``os.path.normcase`` so the check
+    is case-insensitive where the platform is, and only entries that are
+    files (following symlinks, so broken links don't count) match. Any path
+    not matched this way is checked with ``os.path.isfile``, so the result
+    is never worse than a per-path check.
+
+    Args:
+        paths: Iterable of file path strings
+
+    Returns:
+        Set of the given path strings that were found
+    """
+    by_dir: dict[str, list[str]] = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    found = set()
+    for directory, dir_paths in by_dir.items():
+        names = set()
+        try:
+            with os.scandir(directory or ".") as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            names.add(os.path.normcase(entry.name))
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        for p in dir_paths:
+            if (os.path.normcase(os.path.basename(p)) in names
+                    or os.path.isfile(p)):
+                found.add(p)
+    return found
+
+
+@lru_cache(maxsize=None)
+def _group_prefixes(group_path: str) -> tuple[tuple[str, str], ...]:
+    """Split a "/"-separated group path into (part, cache key) pairs.
+
+    The key of each level is its normalised path prefix ("a", "a/b", ...),
+    built once per distinct group path and memoised, since every file in a
+    directory shares its group. Keys go through ``os.path.normcase`` so group
+    matching follows the platform's path case rules.
+    """
+    parts = group_path.split("/")
+    prefixes = accumulate(parts, lambda a, b: f"{a}/{b}")
+    return tuple((part, os.path.normcase(prefix))
+                 for part, prefix in zip(parts, prefixes))
+
+
+class ProjectSaveWorker(QObject):
+    """Worker that encodes and writes a project snapshot off the UI thread.
+
+    The snapshot dict is built on the UI thread (``LabelProject.to_dict``), so
+    the worker never touches the live project.
+    """
+
+    finished = pyqtSignal(object)   # Path that was written
+    failed = pyqtSignal(str)        # error message
+
+    def __init__(self, data: dict, path: Path):
+        """Initialize the worker.
+
+        Args:
+            data: Project snapshot from ``LabelProject.to_dict``
+            path: Destination .geolabel file
+        """
+        super().__init__()
+        self._data = data
+        self._path = path
+
+    def process(self):
+        """Write the snapshot and report the outcome."""
+        try:
+            write_project_json(self._data, self._path)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self._path)
+
+
+class DirectoryScanWorker(QObject):
+    """Worker that discovers image files under a directory off the UI thread.
+
+    Walking a large tree (especially on a network mount) can take a long
+    time, so the scan runs on a QThread and only the finished, sorted file
+    list is handed back to the main thread, which then builds groups and
+    starts the sync or async import.
+    """
+
+    progress = pyqtSignal(int)      # number of files found so far
+    finished = pyqtSignal(list)     # sorted list of path strings
+
+    def __init__(self, root_path: Path):
+        """Initialize the worker.
+
+        Args:
+            root_path: Directory to search recursively for .tif/.tiff files
+        """
+        super().__init__()
+        self._root_path = root_path
+        self._cancelled = False
+
+    def cancel(self):
+        """Request cancellation; the scan stops and reports no files."""
+        self._cancelled = True
+
+    def process(self):
+        """Find all supported files recursively and emit the sorted list."""
+        image_files = []
+        for file_path in _iter_image_files(str(self._root_path)):
+            if self._cancelled:
+                self.finished.emit([])
+                return
+            image_files.append(file_path)
+            if len(image_files) % 100 == 0:
+                self.progress.emit(len(image_files))
+        self.finished.emit(image_files)
+
+
 def get_recovery_dir() -> Path:
     """Get the directory for recovery files (platform-specific)."""
     if platform.system() == "Windows":
@@ -125,6 +343,12 @@ CRASH_MARKER_FILE = RECOVERY_DIR / ".running"
 # Auto-save interval in milliseconds (60 seconds)
 AUTOSAVE_INTERVAL_MS = 60000
 
+# Delay used to coalesce bursts of labeled-panel rebuilds into one
+LABELED_PANEL_REFRESH_MS = 50
+
+# Minimum interval between status-bar progress bar repaints (~60 Hz)
+PROGRESS_UPDATE_MS = 16
+
 
 def _write_recovery_snapshot(
         snapshot: dict, recovery_path: Path, crash_marker_path: Path):
@@ -144,6 +368,7 @@ def _write_recovery_snapshot(
         # Background thread: log only, don't surface to user.
         print(f"Warning: Auto-save write failed: {e}")
 
+
 # Colors for different classes (cycles through these)
 CLASS_COLORS = [
     QColor(255, 50, 50),    # Red
@@ -178,10 +403,13 @@ class MainWindow(QMainWindow):
         # Options (in-memory, default off): when on, measuring one label's
         # length/width propagates to all labels linked to it (same object_id).
         self._wire_meas_to_linked = False
+        # Option (in-memory, default off): build missing pyramid overviews
+        # (external .ovr sidecars) for newly imported images in the background.
+        self._build_overviews_on_import = False
 
         # Async loading state (initialized here to avoid AttributeError)
         self._async_root_path = None
-        self._async_group_cache: dict[Path, any] = {}
+        self._async_group_cache: dict[str, any] = {}
         self._async_loaded_count = 0
         self._async_total_files = 0
         self._async_loader = None
@@ -200,11 +428,36 @@ class MainWindow(QMainWindow):
         self._async_ui_timer.setInterval(100)  # Update UI every 100ms
         self._async_ui_timer.timeout.connect(self._process_pending_async_files)
 
+        # Coordinate display: last text shown and (layer_name, group_path) ->
+        # display name, so mouse moves don't rebuild either needlessly
+        self._last_coord_text = ""
+        self._layer_display_cache: dict[tuple[str, str], str] = {}
+
+        # Class name -> marker colour, rebuilt in _update_class_combo (every
+        # path that changes project.classes ends there)
+        self._class_color_cache: dict[str, QColor] = {}
+
         # Cycle mode state
         self._cycle_layers: list[str] = []  # Layer IDs to cycle through
         # Current position in cycle (-1 means not started)
         self._cycle_index: int = -1
 
+        # Debounce for full labeled-panel rebuilds: rapid link/unlink/measure
+        # events restart the timer, so a burst triggers one rebuild
+        self._panel_refresh_timer = QTimer(self)
+        self._panel_refresh_timer.setSingleShot(True)
+        self._panel_refresh_timer.setInterval(LABELED_PANEL_REFRESH_MS)
+        self._panel_refresh_timer.timeout.connect(
+            self._refresh_labeled_panel_now)
+
+        # Throttle for the status-bar progress bar: per-item progress signals
+        # only record the latest value, which is painted at most once a tick
+        self._progress_value = 0
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_UPDATE_MS)
+        self._progress_timer.timeout.connect(self._apply_progress)
+
         # Auto-save timer for crash recovery
         self._autosave_timer = QTimer()
         self._autosave_timer.setInterval(AUTOSAVE_INTERVAL_MS)
@@ -236,6 +489,43 @@ class MainWindow(QMainWindow):
         self._mosaic_worker: MosaicWorker | None = None
         self._mosaic_dialog = None
 
+        # Sub-image export worker state.
+        self._subimage_thread: QThread | None = None
+        self._subimage_worker: SubimageExportWorker | None = None
+        self._subimage_dialog = None
+        self._subimage_output_dir = ""
+        self._subimage_missing: list[str] = []
+        self._subimage_compress_choice = next(iter(SUBIMAGE_COMPRESSION))
+
+        # Project save worker state (JSON encode + write off the UI thread)
+        self._save_thread: QThread | None = None
+        self._save_worker: ProjectSaveWorker | None = None
+        self._save_dialog: QProgressDialog | None = None
+        self._save_label_count = 0
+        # Project object and snapshot of the save in flight: a completion is
+        # only applied to the same project, and recovery is only cleared if
+        # the project still matches what was written
+        self._save_project_ref: LabelProject | None = None
+        self._save_snapshot: dict | None = None
+        # Destination of a save requested while another was running
+        self._pending_save_path: Path | None = None
+
+        # Overview-build worker state. Imported layers that lack overviews
+        # are queued and processed by one background worker at a time.
+        self._overview_thread: QThread | None = None
+        self._overview_worker: OverviewBuildWorker | None = None
+        self._overview_queue: list[tuple[str, str]] = []
+
+        # Add Directory scan worker state (file discovery off the UI thread).
+        self._dir_scan_thread: QThread | None = None
+        self._dir_scan_worker: DirectoryScanWorker | None = None
+        self._dir_scan_root: Path | None = None
+        # Superseded scans still winding down: (thread, worker) kept alive
+        # until their thread finishes.
+        self._retired_dir_scans: list[tuple[QThread, DirectoryScanWorker]] = []
+        # Set by the status-bar Cancel button for the current directory import
+        self._dir_import_cancelled = False
+
         self._setup_ui()
         self._setup_menu()
         self._setup_toolbar()
@@ -281,6 +571,16 @@ class MainWindow(QMainWindow):
         self.progress_indicator.hide()  # Hidden by default
         self.statusBar.addPermanentWidget(self.progress_indicator)
 
+        # Cancel button for background directory imports (scan + async load)
+        self.progress_cancel_button = QToolButton()
+        self.progress_cancel_button.setText("Cancel")
+        self.progress_cancel_button.setAutoRaise(True)
+        self.progress_cancel_button.setToolTip("Cancel the directory import")
+        self.progress_cancel_button.clicked.connect(
+            self._cancel_directory_import)
+        self.progress_cancel_button.hide()
+        self.statusBar.addPermanentWidget(self.progress_cancel_button)
+
         self.coord_label = QLabel("")
         self.statusBar.addPermanentWidget(self.coord_label)
 
@@ -337,108 +637,44 @@ class MainWindow(QMainWindow):
         """Set up the menu bar."""
         menubar = self.menuBar()
 
-        # File menu
+        # Plain actions are declared as (text, shortcut, slot) rows, with
+        # None for a separator; checkable options are built below.
         file_menu = menubar.addMenu("&File")
+        self._add_menu_actions(file_menu, [
+            ("&New Project", QKeySequence.New, self._new_project),
+            ("&Open Project...", "Ctrl+Shift+P", self._open_project),
+            ("&Save Project", QKeySequence.Save, self._save_project),
+            ("Save Project &As...", "Ctrl+Shift+S", self._save_project_as),
+            None,
+            ("&Add GeoTIFF...", QKeySequence.Open, self._add_geotiff),
+            ("Add &Directory...", "Ctrl+Shift+O", self._add_directory),
+            None,
+            ("&Combine Projects...", None, self._combine_projects),
+            None,
+            # Explicit rather than QKeySequence.Quit, which is unbound on
+            # Windows
+            ("E&xit", "Ctrl+Q", self.close),
+        ])
 
-        # New Project
-        new_project_action = QAction("&New Project", self)
-        new_project_action.setShortcut("Ctrl+N")
-        new_project_action.triggered.connect(self._new_project)
-        file_menu.addAction(new_project_action)
-
-        # Open Project
-        open_project_action = QAction("&Open Project...", self)
-        open_project_action.setShortcut("Ctrl+Shift+P")
-        open_project_action.triggered.connect(self._open_project)
-        file_menu.addAction(open_project_action)
-
-        # Save Project
-        save_project_action = QAction("&Save Project", self)
-        save_project_action.setShortcut("Ctrl+S")
-        save_project_action.triggered.connect(self._save_project)
-        file_menu.addAction(save_project_action)
-
-        # Save Project As
-        save_as_action = QAction("Save Project &As...", self)
-        save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self._save_project_as)
-        file_menu.addAction(save_as_action)
-
-        file_menu.addSeparator()
-
-        # Add GeoTIFF action
-        add_action = QAction("&Add GeoTIFF...", self)
-        add_action.setShortcut("Ctrl+O")
-        add_action.triggered.connect(self._add_geotiff)
-        file_menu.addAction(add_action)
-
-        # Add Directory action
-        add_dir_action = QAction("Add &Directory...", self)
-        add_dir_action.setShortcut("Ctrl+Shift+O")
-        add_dir_action.triggered.connect(self._add_directory)
-        file_menu.addAction(add_dir_action)
-
-        file_menu.addSeparator()
-
-        # Combine Projects
-        combine_action = QAction("&Combine Projects...", self)
-        combine_action.triggered.connect(self._combine_projects)
-        file_menu.addAction(combine_action)
-
-        file_menu.addSeparator()
-
-        # Exit action
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Labels menu
         labels_menu = menubar.addMenu("&Labels")
+        self._add_menu_actions(labels_menu, [
+            ("Edit &Classes...", None, self._edit_classes),
+            None,
+            ("Clear All Labels", None, self._clear_all_labels),
+        ])
 
-        # Edit Classes
-        edit_classes_action = QAction("Edit &Classes...", self)
-        edit_classes_action.triggered.connect(self._edit_classes)
-        labels_menu.addAction(edit_classes_action)
-
-        labels_menu.addSeparator()
-
-        # Clear all labels
-        clear_labels_action = QAction("Clear All Labels", self)
-        clear_labels_action.triggered.connect(self._clear_all_labels)
-        labels_menu.addAction(clear_labels_action)
-
-        # Export menu
         export_menu = menubar.addMenu("&Export")
-
-        # Export Ground Truth
-        export_gt_action = QAction("&Ground Truth...", self)
-        export_gt_action.triggered.connect(self._export_ground_truth)
-        export_menu.addAction(export_gt_action)
-
-        # Export Ground Truth (Labeled Only)
-        export_gt_labeled_action = QAction(
-            "Ground Truth (Labeled Only)...", self)
-        export_gt_labeled_action.triggered.connect(
-            self._export_ground_truth_labeled_only)
-        export_menu.addAction(export_gt_labeled_action)
-
-        # Export Sub-images
-        export_subimages_action = QAction("&Sub-images...", self)
-        export_subimages_action.triggered.connect(self._export_subimages)
-        export_menu.addAction(export_subimages_action)
-
-        export_menu.addSeparator()
-
-        # Export Optimized GeoTIFFs (tiled + pyramided copies)
-        export_optimized_action = QAction("&Optimized GeoTIFFs...", self)
-        export_optimized_action.triggered.connect(self._export_optimized)
-        export_menu.addAction(export_optimized_action)
-
-        # Export Mosaic (combine layers into one raster)
-        export_mosaic_action = QAction("&Mosaic...", self)
-        export_mosaic_action.triggered.connect(self._export_mosaic)
-        export_menu.addAction(export_mosaic_action)
+        self._add_menu_actions(export_menu, [
+            ("&Ground Truth...", None, self._export_ground_truth),
+            ("Ground Truth (Labeled Only)...", None,
+             self._export_ground_truth_labeled_only),
+            ("&Sub-images...", None, self._export_subimages),
+            None,
+            # Tiled + pyramided copies of the loaded GeoTIFFs
+            ("&Optimized GeoTIFFs...", None, self._export_optimized),
+            # Combine layers into one raster
+            ("&Mosaic...", None, self._export_mosaic),
+        ])
 
         # Options menu
         options_menu = menubar.addMenu("&Options")
@@ -452,27 +688,44 @@ class MainWindow(QMainWindow):
         self._wire_meas_action.toggled.connect(self._on_wire_meas_toggled)
         options_menu.addAction(self._wire_meas_action)
 
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-
-        # Keyboard Shortcuts
-        shortcuts_action = QAction("&Keyboard Shortcuts...", self)
-        shortcuts_action.setShortcut("F1")
-        shortcuts_action.triggered.connect(self._show_shortcuts)
-        help_menu.addAction(shortcuts_action)
+        # Build pyramid overviews for imported images that don't have any,
+        # so zoomed-out views read small overview levels instead of full res.
+        self._build_overviews_action = QAction(
+            "Build overviews on import", self)
+        self._build_overviews_action.setCheckable(True)
+        self._build_overviews_action.setChecked(
+            self._build_overviews_on_import)
+        self._build_overviews_action.toggled.connect(
+            self._on_build_overviews_toggled)
+        options_menu.addAction(self._build_overviews_action)
 
-        # About
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        help_menu = menubar.addMenu("&Help")
+        self._add_menu_actions(help_menu, [
+            ("&Keyboard Shortcuts...", "F1", self._show_shortcuts),
+            ("&About", None, self._show_about),
+            None,
+            # Live timestamped debug messages
+            ("&Debug Console", "F12", self._show_debug_console),
+        ])
 
-        help_menu.addSeparator()
+    def _add_menu_actions(self, menu, spec: list):
+        """Add plain actions to a menu from a declarative table.
 
-        # Debug Console (live timestamped debug messages)
-        debug_action = QAction("&Debug Console", self)
-        debug_action.setShortcut("F12")
-        debug_action.triggered.connect(self._show_debug_console)
-        help_menu.addAction(debug_action)
+        Args:
+            menu: Menu to populate
+            spec: Rows of (text, shortcut or None, slot); None adds a
+                separator
+        """
+        for row in spec:
+            if row is None:
+                menu.addSeparator()
+                continue
+            text, shortcut, slot = row
+            action = QAction(text, self)
+            if shortcut is not None:
+                action.setShortcut(shortcut)
+            action.triggered.connect(slot)
+            menu.addAction(action)
 
     def _setup_toolbar(self):
         """Set up the toolbar for labeling."""
@@ -483,50 +736,29 @@ class MainWindow(QMainWindow):
         # Mode selector
         toolbar.addWidget(QLabel(" Mode: "))
 
-        self.pan_action = QAction("Pan", self)
-        self.pan_action.setCheckable(True)
+        # (attribute, text, shortcut, mode, tooltip)
+        mode_actions = [
+            ("pan_action", "Pan", "P", CanvasMode.PAN, None),
+            ("label_action", "Label", "L", CanvasMode.LABEL, None),
+            ("cycle_action", "Cycle", "C", CanvasMode.CYCLE, None),
+            ("view_cycle_action", "View Cycle", "V", CanvasMode.VIEW_CYCLE,
+             None),
+            ("image_cycle_action", "Image Cycle", "I", CanvasMode.IMAGE_CYCLE,
+             "Cycle images with the view rotated to each image's own "
+             "orientation"),
+            ("ruler_action", "Ruler", "R", CanvasMode.RULER, None),
+        ]
+        for attr, text, shortcut, mode, tooltip in mode_actions:
+            action = QAction(text, self)
+            action.setCheckable(True)
+            action.setShortcut(shortcut)
+            if tooltip:
+                action.setToolTip(tooltip)
+            action.triggered.connect(
+                lambda _checked=False, m=mode: self._set_mode(m))
+            toolbar.addAction(action)
+            setattr(self, attr, action)
         self.pan_action.setChecked(True)
-        self.pan_action.setShortcut("P")
-        self.pan_action.triggered.connect(
-            lambda: self._set_mode(CanvasMode.PAN))
-        toolbar.addAction(self.pan_action)
-
-        self.label_action = QAction("Label", self)
-        self.label_action.setCheckable(True)
-        self.label_action.setShortcut("L")
-        self.label_action.triggered.connect(
-            lambda: self._set_mode(CanvasMode.LABEL))
-        toolbar.addAction(self.label_action)
-
-        self.cycle_action = QAction("Cycle", self)
-        self.cycle_action.setCheckable(True)
-        self.cycle_action.setShortcut("C")
-        self.cycle_action.triggered.connect(
-            lambda: self._set_mode(CanvasMode.CYCLE))
-        toolbar.addAction(self.cycle_action)
-
-        self.view_cycle_action = QAction("View Cycle", self)
-        self.view_cycle_action.setCheckable(True)
-        self.view_cycle_action.setShortcut("V")
-        self.view_cycle_action.triggered.connect(
-            lambda: self._set_mode(CanvasMode.VIEW_CYCLE))
-        toolbar.addAction(self.view_cycle_action)
-
-        self.image_cycle_action = QAction("Image Cycle", self)
-        self.image_cycle_action.setCheckable(True)
-        self.image_cycle_action.setShortcut("I")
-        self.image_cycle_action.setToolTip(
-            "Cycle images with the view rotated to each image's own orientation")
-        self.image_cycle_action.triggered.connect(
-            lambda: self._set_mode(CanvasMode.IMAGE_CYCLE))
-        toolbar.addAction(self.image_cycle_action)
-
-        self.ruler_action = QAction("Ruler", self)
-        self.ruler_action.setCheckable(True)
-        self.ruler_action.setShortcut("R")
-        self.ruler_action.triggered.connect(
-            lambda: self._set_mode(CanvasMode.RULER))
-        toolbar.addAction(self.ruler_action)
 
         toolbar.addSeparator()
 
@@ -766,6 +998,9 @@ class MainWindow(QMainWindow):
         current = self.class_combo.currentText()
         self.class_combo.clear()
         self.class_combo.addItems(self.project.classes)
+        self._class_color_cache = {
+            name: CLASS_COLORS[i % len(CLASS_COLORS)]
+            for i, name in enumerate(self.project.classes)}
 
         # Restore selection if possible
         if current in self.project.classes:
@@ -775,10 +1010,7 @@ class MainWindow(QMainWindow):
 
     def _get_class_color(self, class_name: str) -> QColor:
         """Get the color for a class."""
-        if class_name in self.project.classes:
-            idx = self.project.classes.index(class_name)
-            return CLASS_COLORS[idx % len(CLASS_COLORS)]
-        return CLASS_COLORS[0]
+        return self._class_color_cache.get(class_name, CLASS_COLORS[0])
 
     def _on_label_placed(
             self,
@@ -922,7 +1154,7 @@ class MainWindow(QMainWindow):
             synced = self._sync_measurements_in_group(label_id1, label_id2)
 
             # Refresh labeled images panel (grouping may have changed)
-            self.layer_panel.refresh_labeled_panel(self.project)
+            self._schedule_labeled_panel_refresh()
 
             count = len(linked_labels)
             msg = f"Linked labels (object has {count} labels)"
@@ -939,22 +1171,22 @@ class MainWindow(QMainWindow):
 
         self.project.unlink_label(label_id)
 
-        # Update the unlinked label
-        self.canvas.set_label_linked(label_id, False)
+        with self.canvas.batch_updates():
+            # Update the unlinked label and clear its highlight
+            self.canvas.set_label_linked(label_id, False)
+            unhighlight = [label_id]
 
-        # Clear highlight from the unlinked label
-        self.canvas.highlight_labels([label_id], highlight=False)
+            # Update remaining linked labels (if only 1 left, it's no longer
+            # "linked", so its highlight goes too)
+            remaining = [l for _, l in old_linked if l.id != label_id]
+            if len(remaining) == 1:
+                self.canvas.set_label_linked(remaining[0].id, False)
+                unhighlight.append(remaining[0].id)
 
-        # Update remaining linked labels (if only 1 left, it's no longer
-        # "linked")
-        remaining = [l for _, l in old_linked if l.id != label_id]
-        if len(remaining) == 1:
-            self.canvas.set_label_linked(remaining[0].id, False)
-            # Also clear highlight since it's no longer part of a group
-            self.canvas.highlight_labels([remaining[0].id], highlight=False)
+            self.canvas.highlight_labels(unhighlight, highlight=False)
 
         # Refresh labeled images panel (grouping may have changed)
-        self.layer_panel.refresh_labeled_panel(self.project)
+        self._schedule_labeled_panel_refresh()
 
         self.statusBar.showMessage("Label unlinked from object", 3000)
 
@@ -963,14 +1195,11 @@ class MainWindow(QMainWindow):
         linked_labels = self.project.get_linked_labels(label_id)
 
         if linked_labels:
-            # First, clear any existing highlights
-            all_label_ids = [label.id for _,
-                             label in self.project.get_all_labels()]
-            self.canvas.highlight_labels(all_label_ids, highlight=False)
-
-            # Highlight linked labels
-            linked_ids = [label.id for _, label in linked_labels]
-            self.canvas.highlight_labels(linked_ids, highlight=True)
+            # Swap the highlight to the linked group, touching only markers
+            # whose state changes
+            with self.canvas.batch_updates():
+                self.canvas.set_highlight_set(
+                    {label.id for _, label in linked_labels})
 
             self.statusBar.showMessage(
                 f"Showing {
@@ -991,6 +1220,13 @@ class MainWindow(QMainWindow):
         self.statusBar.showMessage(
             f"Wire measurements to linked objects: {state}", 3000)
 
+    def _on_build_overviews_toggled(self, checked: bool):
+        """Enable/disable building missing overviews for imported images."""
+        self._build_overviews_on_import = checked
+        state = "on" if checked else "off"
+        self.statusBar.showMessage(
+            f"Build overviews on import: {state}", 3000)
+
     def _on_label_measured(self, label_id: int, length_m, width_m):
         """Store measured length/width (metres) on a label.
 
@@ -1023,7 +1259,7 @@ class MainWindow(QMainWindow):
             # is a no-op then, and the load path re-adorns it later.
             self.canvas.set_label_measured(
                 lbl.id, has_measurement, length_m, width_m)
-        self.layer_panel.refresh_labeled_panel(self.project)
+        self._schedule_labeled_panel_refresh()
 
         n = len(targets)
         linked_note = f" ({n} linked labels)" if n > 1 else ""
@@ -1059,25 +1295,46 @@ class MainWindow(QMainWindow):
 
     def _refresh_label_markers(self):
         """Refresh all label markers on the canvas."""
-        self.canvas.clear_label_markers()
-        for image, label in self.project.get_all_labels():
-            color = self._get_class_color(label.class_name)
-            self.canvas.add_label_marker(
-                label.id, label.lon, label.lat,
-                image.name, image.group, image.path,
-                label.class_name, color,
-                pixel_x=label.pixel_x, pixel_y=label.pixel_y
-            )
-            # Check if label is linked to others
-            linked_labels = self.project.get_linked_labels(label.id)
-            self.canvas.set_label_linked(label.id, len(linked_labels) > 1)
+        # One repaint for the whole rebuild instead of one per marker
+        with self.canvas.batch_updates():
+            self.canvas.clear_label_markers()
+            all_labels = self.project.get_all_labels()
+            # Positions and class indices go over as arrays; the palette
+            # ends with the fallback colour for unknown classes (index -1)
+            palette = [self._get_class_color(name)
+                       for name in self.project.classes] + [CLASS_COLORS[0]]
+            self.canvas.add_label_markers(
+                self.project.as_arrays(all_labels),
+                [(image.name, image.group, image.path)
+                 for image, _ in all_labels],
+                [label.class_name for _, label in all_labels],
+                palette)
+            # Linked status for every label from one pass over the groups
+            linked_flags = {
+                lid: len(group) > 1
+                for group in self.project.get_object_groups().values()
+                for lid in group
+            }
+            for image, label in all_labels:
+                self.canvas.set_label_linked(
+                    label.id, linked_flags.get(label.id, False))
 
-            # Restore measurement adornment for labels loaded with dimensions
-            if label.length_m is not None or label.width_m is not None:
-                self.canvas.set_label_measured(
-                    label.id, True, label.length_m, label.width_m)
+                # Restore measurement adornment for labels loaded with
+                # dimensions
+                if label.length_m is not None or label.width_m is not None:
+                    self.canvas.set_label_measured(
+                        label.id, True, label.length_m, label.width_m)
 
         # Refresh labeled images panel
+        self._schedule_labeled_panel_refresh()
+
+    def _schedule_labeled_panel_refresh(self):
+        """Rebuild the labeled images panel once the current burst settles."""
+        self._panel_refresh_timer.start()
+
+    def _refresh_labeled_panel_now(self):
+        """Rebuild the labeled images panel from the current project."""
+        self._panel_refresh_timer.stop()
         self.layer_panel.refresh_labeled_panel(self.project)
 
     def _edit_classes(self):
@@ -1090,8 +1347,7 @@ class MainWindow(QMainWindow):
             removed = set(self.project.classes) - set(new_classes)
             if removed:
                 # Warn about label deletion
-                count = sum(
-                    1 for l in self.project.labels if l.class_name in removed)
+                count = self.project.count_labels_in_classes(removed)
                 if count > 0:
                     reply = QMessageBox.question(
                         self,
@@ -1101,12 +1357,8 @@ class MainWindow(QMainWindow):
                     if reply == QMessageBox.No:
                         return
 
-            # Update classes
-            self.project.classes = new_classes
-
-            # Remove labels for deleted classes
-            for class_name in removed:
-                self.project.remove_class(class_name)
+            # Update classes, removing labels of deleted classes
+            self.project.set_classes(new_classes)
 
             self._update_class_combo()
             self._refresh_label_markers()
@@ -1126,7 +1378,7 @@ class MainWindow(QMainWindow):
             self.project.clear()
             self.canvas.clear_label_markers()
             # Refresh labeled images panel (now empty)
-            self.layer_panel.refresh_labeled_panel(self.project)
+            self._schedule_labeled_panel_refresh()
             self.statusBar.showMessage("All labels cleared", 3000)
 
     def _new_project(self):
@@ -1209,9 +1461,11 @@ class MainWindow(QMainWindow):
 
         geotiff_files = []
         missing_files = []
+        present = _existing_paths(
+            image.path for image in self.project.images.values())
 
         for image in self.project.images.values():
-            if not os.path.exists(image.path):
+            if image.path not in present:
                 missing_files.append(image.path)
             else:
                 geotiff_files.append((image.path, image.group or ""))
@@ -1245,76 +1499,6 @@ class MainWindow(QMainWindow):
             skip_project_add=True  # Images already in project
         )
 
-    def _load_project_images(self):
-        """Load images stored in the project and recreate group structure."""
-
-        loaded = 0
-        missing = []
-
-        # Group cache for recreating hierarchy
-        group_cache: dict[str, any] = {}
-
-        def get_or_create_group(group_path: str):
-            """Get or create group hierarchy for a group path."""
-            if not group_path:
-                return None
-
-            if group_path in group_cache:
-                return group_cache[group_path]
-
-            # Split path and create hierarchy
-            parts = group_path.replace("\\", "/").split("/")
-            parent = None
-            current_path = ""
-
-            for part in parts:
-                current_path = f"{current_path}/{part}" if current_path else part
-                if current_path not in group_cache:
-                    group = self.layer_panel.add_group(part, parent)
-                    group_cache[current_path] = group
-                parent = group_cache[current_path]
-
-            return parent
-
-        for idx, image in enumerate(self.project.images.values()):
-            if os.path.exists(image.path):
-                if image.crs_epsg is not None:
-                    # Georeferenced image
-                    layer_id = self.canvas.add_layer(image.path)
-                    if layer_id:
-                        parent_group = get_or_create_group(image.group)
-                        self.layer_panel.add_layer(
-                            layer_id, image.path, parent_group)
-                        self.canvas.set_layer_group(layer_id, image.group)
-                        loaded += 1
-                else:
-                    # Non-georeferenced image
-                    layer_id = self.canvas.add_pixel_layer(
-                        image.path, group_path=image.group)
-                    if layer_id:
-                        nongeo_parent = self.layer_panel.add_nongeo_group(
-                            image.group.split("/")[-1] if image.group else "Ungrouped")
-                        self.layer_panel.add_nongeo_layer(
-                            layer_id, image.path, nongeo_parent)
-                        loaded += 1
-            else:
-                missing.append(image.path)
-
-            # Update progress indicator (progress bar repaints itself)
-            self._update_progress(idx + 1)
-
-        # Collapse all groups (user expands as needed)
-        self.layer_panel.tree.collapseAll()
-
-        if missing:
-            QMessageBox.warning(
-                self,
-                "Missing Images",
-                f"Could not find {len(missing)} image(s):\n" +
-                "\n".join(missing[:5]) +
-                ("\n..." if len(missing) > 5 else "")
-            )
-
     # -------------------------------------------------------------------------
     # Crash Recovery / Auto-Save
     # -------------------------------------------------------------------------
@@ -1419,12 +1603,7 @@ class MainWindow(QMainWindow):
             # Build the serializable snapshot on the UI thread for consistency
             # with the project state. This is pure-Python and does not perform
             # any I/O.
-            snapshot = {
-                "version": "3.2",
-                "classes": list(self.project.classes),
-                "images": [img.to_dict() for img in self.project.images.values()],
-                "_next_id": self.project._next_id,
-            }
+            snapshot = self.project.to_dict()
             recovery_path = RECOVERY_FILE
             crash_marker_path = CRASH_MARKER_FILE
 
@@ -1485,19 +1664,92 @@ class MainWindow(QMainWindow):
             self._do_save(Path(file_path))
 
     def _do_save(self, path: Path):
-        """Perform the actual save operation."""
-        try:
-            self.project.save(path)
-            self._project_path = path
-            self.setWindowTitle(f"GeoLabel - {path.name}")
+        """Save the project to ``path`` on a background thread.
+
+        The snapshot is taken here on the UI thread; encoding and writing run
+        on a ProjectSaveWorker and finish in _on_save_finished.
+        """
+        if self._save_thread is not None:
+            # Run it once the current save is done (latest request wins)
+            self._pending_save_path = path
             self.statusBar.showMessage(
-                f"Saved {
-                    self.project.label_count} labels to {
-                    path.name}", 3000)
-            # Clear recovery file after successful save
-            self._clear_recovery_file()
+                f"Save to {path.name} queued after the current save", 3000)
+            return
+
+        try:
+            data = self.project.to_dict()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save project: {e}")
+            return
+        self._save_label_count = self.project.label_count
+        self._save_project_ref = self.project
+        self._save_snapshot = data
+
+        # Busy indicator with no cancel button (a half-written save is worse
+        # than waiting). Shown immediately: being window-modal, it blocks
+        # edits and project switches until the save completes.
+        dlg = QProgressDialog(f"Saving {path.name}...", None, 0, 0, self)
+        dlg.setWindowTitle("Saving Project")
+        dlg.setCancelButton(None)
+        dlg.setWindowModality(QtCore_Qt.WindowModal)
+        dlg.setMinimumDuration(0)
+        dlg.show()
+
+        thread = QThread(self)
+        worker = ProjectSaveWorker(data, path)
+        worker.moveToThread(thread)
+
+        self._save_thread = thread
+        self._save_worker = worker
+        self._save_dialog = dlg
+
+        worker.finished.connect(self._on_save_finished)
+        worker.failed.connect(self._on_save_failed)
+        thread.started.connect(worker.process)
+        thread.finished.connect(self._on_save_thread_finished)
+
+        thread.start()
+
+    def _on_save_finished(self, path: Path):
+        """Record a completed save (main thread).
+
+        Ignored (beyond a status message) if another project has been opened
+        since the save started. Recovery is kept if the project changed
+        after the snapshot was taken.
+        """
+        self._close_save_dialog()
+        self.statusBar.showMessage(
+            f"Saved {self._save_label_count} labels to {path.name}", 3000)
+        if self._save_project_ref is not self.project:
+            return
+        self._project_path = path
+        self.setWindowTitle(f"GeoLabel - {path.name}")
+        # Clear recovery file only if nothing changed since the snapshot
+        if self.project.to_dict() == self._save_snapshot:
+            self._clear_recovery_file()
+
+    def _on_save_failed(self, error: str):
+        """Report a failed save (main thread)."""
+        self._close_save_dialog()
+        QMessageBox.critical(self, "Error", f"Failed to save project: {error}")
+
+    def _close_save_dialog(self):
+        """Close the save progress dialog and stop the worker thread."""
+        if self._save_dialog is not None:
+            self._save_dialog.close()
+        if self._save_thread is not None:
+            self._save_thread.quit()
+
+    def _on_save_thread_finished(self):
+        """Drop save worker references and start any queued save."""
+        self._save_thread = None
+        self._save_worker = None
+        self._save_dialog = None
+        self._save_project_ref = None
+        self._save_snapshot = None
+        if self._pending_save_path is not None:
+            path, self._pending_save_path = self._pending_save_path, None
+            self._do_save(path)
 
     def _combine_projects(self):
         """Combine two .geolabel project files into a new project file."""
@@ -1545,44 +1797,36 @@ class MainWindow(QMainWindow):
                     project1.classes +
                     project2.classes))
 
-            # Create combined project and deep-copy images/labels from project1
+            # Create combined project. Both source projects were just loaded
+            # from disk and are discarded afterwards, so their ImageData and
+            # labels are moved into the combined project instead of cloned.
             combined = LabelProject()
             combined.classes = combined_classes
-
-            # Helper: clone ImageData (and contained labels) to avoid mutating
-            # originals
-            def clone_image(image: ImageData) -> ImageData:
-                """Deep-copy an ImageData (and its labels) via serialization."""
-                return ImageData.from_dict(image.to_dict())
-
-            # Track maximum label id
-            max_id = 0
-
-            for path, image in project1.images.items():
-                new_img = clone_image(image)
-                combined.images[path] = new_img
-                for lbl in new_img.labels:
-                    if lbl.id > max_id:
-                        max_id = lbl.id
-
-            # Offset for project2 labels to ensure unique IDs
-            id_offset = max_id
-
-            # Merge images and labels from project2 (cloned, with remapped ids)
+            combined.images.update(project1.images)
+
+            # Offset for project2 labels to ensure unique IDs; the combined
+            # maximum follows from each project's maximum, so the remap loop
+            # below does no comparisons
+            id_offset = max((lbl.id for image in project1.images.values()
+                             for lbl in image.labels), default=0)
+            max_id = id_offset + max(
+                (lbl.id for image in project2.images.values()
+                 for lbl in image.labels), default=0)
+
+            # Merge images and labels from project2 (with remapped ids)
             for path, image in project2.images.items():
-                cloned = clone_image(image)
-                for lbl in cloned.labels:
-                    lbl.id = lbl.id + id_offset
-                    if lbl.id > max_id:
-                        max_id = lbl.id
+                for lbl in image.labels:
+                    lbl.id += id_offset
 
                 if path in combined.images:
-                    combined.images[path].labels.extend(cloned.labels)
+                    combined.images[path].labels.extend(image.labels)
                 else:
-                    combined.images[path] = cloned
+                    combined.images[path] = image
 
-            # Set next id
+            # Set next id; the images were merged directly, so index them
+            # (label_count and save-time lookups rely on the indexes)
             combined._next_id = max_id + 1
+            combined._rebuild_index()
 
             # Save combined project
             combined.save(output_file)
@@ -1651,25 +1895,25 @@ class MainWindow(QMainWindow):
 
         try:
             # Collect only images that have at least one label
-            images = [img.to_dict()
-                      for img in self.project.images.values() if img.labels]
+            images = [img for img in self.project.images.values()
+                      if img.labels]
 
             if not images:
                 QMessageBox.information(
                     self, "Export", "No labeled images to export.")
                 return
 
+            # Images are serialised one at a time as they are written
             data = {
                 "version": "3.2",
                 "classes": self.project.classes,
-                "images": images,
+                "images": (img.to_dict() for img in images),
                 "_next_id": self.project._next_id
             }
 
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_project_json(data, file_path)
 
-            total_labels = sum(len(img['labels']) for img in images)
+            total_labels = sum(len(img.labels) for img in images)
             self.statusBar.showMessage(
                 f"Exported {total_labels} labels from {
                     len(images)} images to {file_path}",
@@ -1852,35 +2096,12 @@ class MainWindow(QMainWindow):
         self._mosaic_worker = None
         self._mosaic_dialog = None
 
-    @staticmethod
-    def _ground_res_per_pixel(src, px: int, py: int) -> tuple[float, float]:
-        """Measure true ground metres per pixel at a pixel, for any CRS.
-
-        Projects the pixel and its immediate right/below neighbours to WGS84
-        and takes geodesic (Haversine) distances, so the result is correct for
-        projected, geographic and Web Mercator sources alike (the last of which
-        has a cos(lat) scale factor that raw transform coefficients ignore) and
-        for non-square pixels.
+    def _export_subimages(self):
+        """Export sub-images centered on labels as GeoTIFFs preserving original pixels.
 
-        Returns (metres_per_pixel_x, metres_per_pixel_y); (0, 0) if it can't be
-        determined.
+        The raster I/O runs on a SubimageExportWorker thread (labels fan out to
+        a thread pool); results are reported in _on_subimage_finished.
         """
-        try:
-            transformer = Transformer.from_crs(src.crs, 4326, always_xy=True)
-            ax, ay = src.transform * (px, py)
-            bx, by = src.transform * (px + 1, py)
-            cx, cy = src.transform * (px, py + 1)
-            a_lon, a_lat = transformer.transform(ax, ay)
-            b_lon, b_lat = transformer.transform(bx, by)
-            c_lon, c_lat = transformer.transform(cx, cy)
-            mppx = haversine_distance(a_lat, a_lon, b_lat, b_lon)
-            mppy = haversine_distance(a_lat, a_lon, c_lat, c_lon)
-            return mppx, mppy
-        except Exception:
-            return 0.0, 0.0
-
-    def _export_subimages(self):
-        """Export sub-images centered on labels as GeoTIFFs preserving original pixels."""
 
         if self.project.label_count == 0:
             QMessageBox.information(self, "Export", "No labels to export.")
@@ -1899,6 +2120,20 @@ class MainWindow(QMainWindow):
         if not ok:
             return
 
+        # Prompt for compression (remembered for the session)
+        choices = list(SUBIMAGE_COMPRESSION)
+        choice, ok = QInputDialog.getItem(
+            self,
+            "Sub-image Compression",
+            "Compression for the exported GeoTIFFs:",
+            choices,
+            choices.index(self._subimage_compress_choice),
+            False
+        )
+        if not ok:
+            return
+        self._subimage_compress_choice = choice
+
         # Prompt for output directory
         output_dir = QFileDialog.getExistingDirectory(
             self,
@@ -1911,182 +2146,70 @@ class MainWindow(QMainWindow):
 
         output_path = Path(output_dir)
 
-        # Progress dialog
-        progress = QProgressDialog(
+        # Snapshot the work list on the UI thread, one job per source image so
+        # each GeoTIFF is opened once; the modal progress dialog keeps the
+        # project from being edited while the export runs. Missing sources
+        # are screened out with one directory listing per folder.
+        labelled = [image_data for image_data in self.project.images.values()
+                    if image_data.labels]
+        present = _existing_paths(image_data.path for image_data in labelled)
+        jobs = [(image_data.path, list(image_data.labels))
+                for image_data in labelled if image_data.path in present]
+        self._subimage_missing = [
+            f"Image not found: {image_data.path}"
+            for image_data in labelled if image_data.path not in present]
+        total_labels = sum(len(labels) for _path, labels in jobs)
+
+        dlg = QProgressDialog(
             "Exporting sub-images...",
             "Cancel",
             0,
-            self.project.label_count,
+            total_labels,
             self)
-        progress.setWindowModality(QtCore_Qt.WindowModal)
-        progress.setMinimumDuration(0)
-
-        exported = 0
-        errors = []
-
-        for idx, (image_data, label) in enumerate(
-                self.project.get_all_labels()):
-            if progress.wasCanceled():
-                break
-
-            progress.setValue(idx)
-
-            image_path = image_data.path
-            if not os.path.exists(image_path):
-                errors.append(f"Image not found: {image_path}")
-                continue
-
-            try:
-                with rasterio.open(image_path) as src:
-                    # Handle missing CRS
-                    if src.crs is None:
-                        errors.append(f"Image has no CRS: {image_path}")
-                        continue
+        dlg.setWindowTitle("Exporting Sub-images")
+        dlg.setWindowModality(QtCore_Qt.WindowModal)
+        dlg.setMinimumDuration(0)
+        dlg.setValue(0)
 
-                    # Label pixel in the ORIGINAL image (absolute pixel coords)
-                    pixel_x = int(round(label.pixel_x))
-                    pixel_y = int(round(label.pixel_y))
-
-                    # Skip if pixel coordinates are outside image bounds
-                    if (pixel_x < 0 or pixel_x >= src.width
-                            or pixel_y < 0 or pixel_y >= src.height):
-                        errors.append(
-                            f"Label {label.id}: pixel coords "
-                            f"({pixel_x}, {pixel_y}) outside image bounds "
-                            f"({src.width}x{src.height})")
-                        continue
+        thread = QThread(self)
+        worker = SubimageExportWorker(
+            jobs, size_meters, output_path,
+            compress=SUBIMAGE_COMPRESSION[self._subimage_compress_choice])
+        worker.moveToThread(thread)
 
-                    # True ground metres per pixel at the label, measured from
-                    # the actual pixel geometry so it is correct for any CRS
-                    # (projected, geographic, or Web Mercator) and for
-                    # non-square pixels.
-                    pixel_width_m, pixel_height_m = self._ground_res_per_pixel(
-                        src, pixel_x, pixel_y)
-                    if pixel_width_m <= 0 or pixel_height_m <= 0:
-                        errors.append(
-                            f"Label {label.id}: could not determine pixel "
-                            f"resolution")
-                        continue
+        self._subimage_thread = thread
+        self._subimage_worker = worker
+        self._subimage_dialog = dlg
+        self._subimage_output_dir = output_dir
 
-                    # Pixels spanning the requested square ground region.
-                    half_size_px_x = max(
-                        1, int((size_meters / 2) / pixel_width_m))
-                    half_size_px_y = max(
-                        1, int((size_meters / 2) / pixel_height_m))
-                    full_size_px_x = half_size_px_x * 2
-                    full_size_px_y = half_size_px_y * 2
-
-                    # Calculate initial window bounds (centered on label)
-                    col_start = pixel_x - half_size_px_x
-                    col_end = pixel_x + half_size_px_x
-                    row_start = pixel_y - half_size_px_y
-                    row_end = pixel_y + half_size_px_y
-
-                    # Handle edge cases by shifting the window to stay within bounds
-                    # while maintaining the full requested size if possible
-                    if col_start < 0:
-                        # Shift window right
-                        shift = -col_start
-                        col_start = 0
-                        col_end = min(src.width, col_end + shift)
-                    if col_end > src.width:
-                        # Shift window left
-                        shift = col_end - src.width
-                        col_end = src.width
-                        col_start = max(0, col_start - shift)
-
-                    if row_start < 0:
-                        # Shift window down
-                        shift = -row_start
-                        row_start = 0
-                        row_end = min(src.height, row_end + shift)
-                    if row_end > src.height:
-                        # Shift window up
-                        shift = row_end - src.height
-                        row_end = src.height
-                        row_start = max(0, row_start - shift)
-
-                    # Final clamp to ensure we're within bounds
-                    col_start = max(0, col_start)
-                    col_end = min(src.width, col_end)
-                    row_start = max(0, row_start)
-                    row_end = min(src.height, row_end)
-
-                    window_width = col_end - col_start
-                    window_height = row_end - row_start
-
-                    # Skip if the resulting window is too small or invalid
-                    if window_width <= 0 or window_height <= 0:
-                        errors.append(
-                            f"Label {
-                                label.id}: invalid window size, skipped")
-                        continue
+        worker.progress.connect(self._on_subimage_progress)
+        worker.finished.connect(self._on_subimage_finished)
+        thread.started.connect(worker.process)
+        thread.finished.connect(self._on_subimage_thread_finished)
+        dlg.canceled.connect(worker.cancel, Qt.DirectConnection)
 
-                    if window_width < full_size_px_x // 2 or window_height < full_size_px_y // 2:
-                        errors.append(
-                            f"Label {
-                                label.id} too close to edge, skipped")
-                        continue
+        thread.start()
 
-                    # Read the window using bounded reading
-                    window = rasterio.windows.Window(
-                        col_off=col_start,
-                        row_off=row_start,
-                        width=window_width,
-                        height=window_height
-                    )
-
-                    # Use boundless=False to ensure we stay within image bounds
-                    data = src.read(window=window, boundless=False)
-
-                    # Create output directory for this class
-                    class_dir = output_path / label.class_name
-                    class_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Generate unique filename: {object_id}_{label_id:06d}.tif
-                    out_filename = f"{label.object_id}_{label.id:06d}.tif"
-                    out_path = class_dir / out_filename
-
-                    # Calculate the transform for the sub-image window
-                    # (preserves original CRS)
-                    window_transform = rasterio.windows.transform(
-                        window, src.transform)
-
-                    # Write the cropped pixels unmodified: all source bands at
-                    # the original dtype, preserving CRS/transform, colour
-                    # interpretation and nodata so RGB (or any multi-band) data
-                    # round-trips exactly.
-                    with rasterio.open(
-                        out_path,
-                        'w',
-                        driver='GTiff',
-                        height=window_height,
-                        width=window_width,
-                        count=data.shape[0],
-                        dtype=data.dtype,
-                        crs=src.crs,
-                        transform=window_transform,
-                        nodata=src.nodata,
-                        compress='lzw'
-                    ) as dst:
-                        dst.write(data)
-                        # Preserve per-band colour interpretation (RGB tagging).
-                        try:
-                            dst.colorinterp = src.colorinterp
-                        except Exception:
-                            pass
-
-                    exported += 1
+    def _on_subimage_progress(self, processed: int, total: int):
+        """Update the sub-image export progress dialog (main thread)."""
+        if self._subimage_dialog is not None:
+            self._subimage_dialog.setValue(processed)
 
-            except Exception as e:
-                errors.append(
-                    f"Error processing label {
-                        label.id} from {image_path}: {e}")
+    def _on_subimage_finished(self, exported: int, errors: list,
+                              cancelled: bool):
+        """Report the sub-image export result and stop the worker thread."""
+        if self._subimage_dialog is not None:
+            self._subimage_dialog.setValue(self._subimage_dialog.maximum())
+        if self._subimage_thread is not None:
+            self._subimage_thread.quit()
 
-        progress.setValue(self.project.label_count)
+        errors = self._subimage_missing + errors
+        self._subimage_missing = []
 
         # Show results
-        msg = f"Exported {exported} sub-images to {output_dir}"
+        msg = f"Exported {exported} sub-images to {self._subimage_output_dir}"
+        if cancelled:
+            msg = f"Export cancelled. {msg}"
         if errors:
             msg += f"\n\n{len(errors)} errors occurred:\n" + \
                 "\n".join(errors[:5])
@@ -2097,6 +2220,12 @@ class MainWindow(QMainWindow):
             self.statusBar.showMessage(msg, 5000)
             QMessageBox.information(self, "Export Complete", msg)
 
+    def _on_subimage_thread_finished(self):
+        """Drop sub-image export worker references (main thread)."""
+        self._subimage_thread = None
+        self._subimage_worker = None
+        self._subimage_dialog = None
+
     def _add_geotiff(self):
         """Open file dialog to add a GeoTIFF image."""
         file_filter = "GeoTIFF (*.tif *.tiff);;All Files (*)"
@@ -2104,7 +2233,8 @@ class MainWindow(QMainWindow):
             self,
             "Add Image",
             "",
-            file_filter
+            file_filter,
+            options=IMAGE_DIALOG_OPTIONS
         )
 
         skipped = 0
@@ -2133,6 +2263,7 @@ class MainWindow(QMainWindow):
                     self.layer_panel.add_nongeo_layer(layer_id, file_path)
 
             if layer_id:
+                self._queue_overview_build(layer_id, file_path)
                 # Track the loaded image with original dimensions and transform
                 name = Path(file_path).stem
                 width, height = self.canvas.get_layer_source_dimensions(
@@ -2146,11 +2277,14 @@ class MainWindow(QMainWindow):
             self.statusBar.showMessage(
                 f"Skipped {skipped} already loaded image(s)", 3000)
 
+        self._start_overview_build()
+
     def _add_directory(self):
         """Open directory dialog and load all supported images preserving directory structure.
 
         Uses async loading for better performance with large directories:
-        - Files are discovered and tree structure is built immediately
+        - Files are discovered on a background thread, then the tree
+          structure is built
         - Actual file loading happens in background
         - Layers default to hidden (unchecked) during import
         - User can start working while files continue loading
@@ -2159,21 +2293,64 @@ class MainWindow(QMainWindow):
             self,
             "Select Directory with Images",
             "",
-            QFileDialog.ShowDirsOnly
+            QFileDialog.ShowDirsOnly | IMAGE_DIALOG_OPTIONS
         )
 
         if not dir_path:
             return
 
-        # Find all supported files recursively
-        root_path = Path(dir_path)
-        image_files = []
-        for pattern in ("*.tif", "*.tiff"):
-            image_files.extend(root_path.rglob(pattern))
-        # Deduplicate (in case of overlapping patterns) and sort
-        image_files = sorted(set(image_files))
+        self._start_directory_scan(Path(dir_path))
+
+    def _start_directory_scan(self, root_path: Path):
+        """Discover image files under ``root_path`` on a worker thread.
+
+        The import continues in ``_on_directory_scan_finished`` once the file
+        list is ready, so the UI stays responsive while the tree is walked.
+        A scan that is still running is cancelled first, so only the newest
+        directory is imported.
+        """
+        self._retire_directory_scan()
+
+        thread = QThread(self)
+        worker = DirectoryScanWorker(root_path)
+        worker.moveToThread(thread)
+
+        # Keep references so they aren't garbage-collected mid-scan.
+        self._dir_scan_thread = thread
+        self._dir_scan_worker = worker
+        self._dir_scan_root = root_path
+        self._dir_import_cancelled = False
+
+        worker.progress.connect(self._on_directory_scan_progress)
+        worker.finished.connect(self._on_directory_scan_finished)
+        thread.started.connect(worker.process)
+        thread.finished.connect(self._on_directory_scan_thread_finished)
+
+        # The file count isn't known yet, so show a busy bar until it is
+        self._show_progress(0, "Scanning")
+        self.progress_cancel_button.show()
+        self.statusBar.showMessage(f"Scanning {root_path.name} for images...")
+        thread.start()
+
+    def _on_directory_scan_progress(self, found: int):
+        """Show how many files the directory scan has found so far."""
+        self.statusBar.showMessage(
+            f"Scanning {self._dir_scan_root.name}: {found} images found...")
+
+    def _on_directory_scan_finished(self, image_files: list):
+        """Start the import once the scan has produced the file list."""
+        root_path = self._dir_scan_root
+        if self._dir_scan_thread is not None:
+            self._dir_scan_thread.quit()
+        self._hide_progress()
+
+        if self._dir_import_cancelled:
+            self.progress_cancel_button.hide()
+            self.statusBar.showMessage("Directory scan cancelled", 5000)
+            return
 
         if not image_files:
+            self.progress_cancel_button.hide()
             self.statusBar.showMessage(
                 "No supported image files found in directory", 5000)
             return
@@ -2182,10 +2359,65 @@ class MainWindow(QMainWindow):
         use_async = len(image_files) > 50
 
         if use_async:
+            # The status-bar Cancel button stays up for the background load
             self._add_directory_async(root_path, image_files)
         else:
+            # The sync import has its own modal dialog with a Cancel button
+            self.progress_cancel_button.hide()
             self._add_directory_sync(root_path, image_files)
 
+    def _cancel_directory_import(self):
+        """Stop the running directory scan or background directory load."""
+        self._dir_import_cancelled = True
+        self.progress_cancel_button.hide()
+        if self._dir_scan_worker is not None:
+            self._dir_scan_worker.cancel()
+        elif self._async_loader is not None and self._async_mode == "directory":
+            # The loader stops between header batches and still reports
+            # completion, so the files loaded so far are kept.
+            self._async_loader.cancel()
+            self.statusBar.showMessage("Cancelling directory import...")
+
+    def _retire_directory_scan(self):
+        """Cancel the current scan (if any) and detach it from the UI.
+
+        Its results and progress are disconnected so a stale file list can
+        never start an import. The thread and worker are kept referenced
+        until the thread finishes, since the walk may still be inside a slow
+        directory listing.
+        """
+        thread = self._dir_scan_thread
+        worker = self._dir_scan_worker
+        if thread is None or worker is None:
+            return
+        worker.progress.disconnect(self._on_directory_scan_progress)
+        worker.finished.disconnect(self._on_directory_scan_finished)
+        thread.finished.disconnect(self._on_directory_scan_thread_finished)
+
+        # Hook up the release before stopping the scan so a thread that
+        # finishes straight away can't miss it; one that had already
+        # finished is released directly.
+        entry = (thread, worker)
+        self._retired_dir_scans.append(entry)
+        thread.finished.connect(lambda: self._drop_retired_scan(entry))
+        self._dir_scan_thread = None
+        self._dir_scan_worker = None
+        if thread.isFinished():
+            self._drop_retired_scan(entry)
+            return
+        worker.cancel()
+        thread.quit()
+
+    def _drop_retired_scan(self, entry: tuple):
+        """Release a superseded scan once its thread has stopped."""
+        if entry in self._retired_dir_scans:
+            self._retired_dir_scans.remove(entry)
+
+    def _on_directory_scan_thread_finished(self):
+        """Drop the scan worker refs once its thread has stopped."""
+        self._dir_scan_thread = None
+        self._dir_scan_worker = None
+
     def _add_directory_sync(self, root_path: Path, image_files: list):
         """Synchronous directory loading for smaller imports."""
         # Create root group for the selected directory
@@ -2193,21 +2425,11 @@ class MainWindow(QMainWindow):
         root_group = self.layer_panel.add_group(
             root_group_name, None, visible=False)
 
-        # Build directory structure with groups under the root group
-        group_cache: dict[Path, any] = {}
-        nongeo_group_cache: dict[str, any] = {}
+        # Relative directory of each file as a '/'-separated string ("" for
+        # files at the root level)
+        rel_dirs = _relative_dirs(root_path, image_files)
 
-        def get_or_create_group(rel_dir: Path):
-            """Return the panel group for a directory, creating parents as needed."""
-            if rel_dir == Path("."):
-                return root_group  # Files at root level go under the root group
-            if rel_dir in group_cache:
-                return group_cache[rel_dir]
-            parent_group = get_or_create_group(rel_dir.parent)
-            group = self.layer_panel.add_group(
-                rel_dir.name, parent_group, visible=False)
-            group_cache[rel_dir] = group
-            return group
+        nongeo_group_cache: dict[str, any] = {}
 
         def get_or_create_nongeo_group(name: str):
             """Return the cached non-geo panel group for a name, creating it once."""
@@ -2231,72 +2453,112 @@ class MainWindow(QMainWindow):
         progress.setValue(0)
 
         loaded_count = 0
-        for i, file_path in enumerate(image_files):
-            if progress.wasCanceled():
-                break
+        # Project entries for the loaded files, added in one call at the end
+        project_rows: list[tuple] = []
+        # Layer rows collected per parent group and inserted with one
+        # add_layers call each: (parent item, [(layer_id, path), ...])
+        geo_rows: dict[str, tuple[any, list[tuple[str, str]]]] = {}
+        nongeo_rows: dict[str, tuple[any, list[tuple[str, str]]]] = {}
+        # Suppress per-insert tree relayout/repaint and per-layer canvas
+        # restacking while adding items; both are done once when the batch ends.
+        self.layer_panel.begin_batch_update()
+        self.canvas.begin_batch_update()
+        try:
+            # Build directory structure with groups under the root group. Every
+            # directory (including intermediate ones without files) is created
+            # once up front, parents first, so the file loop is a plain lookup.
+            all_dirs = set()
+            for rel_dir in set(rel_dirs):
+                parts = rel_dir.split("/") if rel_dir else []
+                for depth in range(1, len(parts) + 1):
+                    all_dirs.add("/".join(parts[:depth]))
+            group_cache: dict[str, any] = {"": root_group}
+            for rel_dir in sorted(all_dirs, key=lambda d: (d.count("/"), d)):
+                parent_dir, _, dir_name = rel_dir.rpartition("/")
+                group_cache[rel_dir] = self.layer_panel.add_group(
+                    dir_name, group_cache[parent_dir], visible=False)
+
+            last_ui_update = 0.0
+            total = len(image_files)
+            for i, (file_path_str, rel_dir_str) in enumerate(
+                    zip(image_files, rel_dirs)):
+                if progress.wasCanceled():
+                    break
+
+                # Repaint the dialog and pump events at a fixed rate rather
+                # than once per file; fast local files load far quicker than
+                # a frame, so per-file updates were mostly Qt overhead.
+                now = time.monotonic()
+                if now - last_ui_update >= SYNC_IMPORT_UI_INTERVAL_S:
+                    last_ui_update = now
+                    progress.setValue(i)
+                    progress.setLabelText(
+                        f"Loading {os.path.basename(file_path_str)}..."
+                        f"\n({i + 1} of {total})")
+                    QApplication.processEvents()
+
+                parent_group = group_cache[rel_dir_str]
+
+                if self.canvas.is_path_loaded(file_path_str):
+                    continue
 
-            progress.setValue(i)
-            progress.setLabelText(
-                f"Loading {
-                    file_path.name}...\n({
-                    i +
-                    1} of {
-                    len(image_files)})")
-            QApplication.processEvents()
-
-            rel_path = file_path.relative_to(root_path)
-            rel_dir = rel_path.parent
-            parent_group = get_or_create_group(rel_dir)
-
-            file_path_str = str(file_path)
-            if self.canvas.is_path_loaded(file_path_str):
-                continue
+                # Check CRS to decide geo vs pixel-mode loading
+                has_crs = True
+                try:
+                    with rasterio.open(file_path_str) as src:
+                        if src.crs is None:
+                            has_crs = False
+                except Exception:
+                    pass
 
-            # Check CRS to decide geo vs pixel-mode loading
-            has_crs = True
-            try:
-                with rasterio.open(file_path_str) as src:
-                    if src.crs is None:
-                        has_crs = False
-            except Exception:
-                pass
+                group_path_str = f"{root_group_name}/{rel_dir_str}" if rel_dir_str else root_group_name
 
-            rel_dir_str = str(rel_dir).replace(
-                "\\", "/") if rel_dir != Path(".") else ""
-            group_path_str = f"{root_group_name}/{rel_dir_str}" if rel_dir_str else root_group_name
+                if has_crs:
+                    layer_id = self.canvas.add_layer(
+                        file_path_str, visible=False)
+                    if layer_id:
+                        geo_rows.setdefault(
+                            rel_dir_str, (parent_group, []))[1].append(
+                            (layer_id, file_path_str))
+                        self.canvas.set_layer_group(layer_id, group_path_str)
+                else:
+                    layer_id = self.canvas.add_pixel_layer(
+                        file_path_str, group_path=group_path_str, visible=False)
+                    if layer_id:
+                        nongeo_name = (rel_dir_str.rpartition("/")[2]
+                                       or root_group_name)
+                        if nongeo_name not in nongeo_rows:
+                            nongeo_rows[nongeo_name] = (
+                                get_or_create_nongeo_group(nongeo_name), [])
+                        nongeo_rows[nongeo_name][1].append(
+                            (layer_id, file_path_str))
 
-            if has_crs:
-                layer_id = self.canvas.add_layer(
-                    file_path_str, visible=False)
-                if layer_id:
-                    self.layer_panel.add_layer(
-                        layer_id, file_path_str, parent_group, visible=False)
-                    self.canvas.set_layer_group(layer_id, group_path_str)
-            else:
-                layer_id = self.canvas.add_pixel_layer(
-                    file_path_str, group_path=group_path_str, visible=False)
                 if layer_id:
-                    nongeo_parent = get_or_create_nongeo_group(
-                        rel_dir.name if rel_dir != Path(".") else root_group_name)
-                    self.layer_panel.add_nongeo_layer(
-                        layer_id, file_path_str, nongeo_parent, visible=False)
-
-            if layer_id:
-                name = file_path.stem
-                width, height = self.canvas.get_layer_source_dimensions(
-                    layer_id)
-                affine, crs = self.canvas.get_layer_transform(layer_id)
-                self.project.add_image(
-                    file_path_str, name, group_path_str, width, height,
-                    affine=affine, crs=crs)
-                loaded_count += 1
+                    self._queue_overview_build(layer_id, file_path_str)
+                    name = Path(file_path_str).stem
+                    width, height = self.canvas.get_layer_source_dimensions(
+                        layer_id)
+                    affine, crs = self.canvas.get_layer_transform(layer_id)
+                    project_rows.append((file_path_str, name, group_path_str,
+                                         width, height, affine, crs))
+                    loaded_count += 1
+        finally:
+            self.project.add_images(project_rows)
+            for parent, rows in geo_rows.values():
+                self.layer_panel.add_layers(rows, parent, visible=False)
+            for parent, rows in nongeo_rows.values():
+                self.layer_panel.add_nongeo_layers(rows, parent, visible=False)
+            self.canvas.end_batch_update()
+            self.layer_panel.end_batch_update()
 
         progress.setValue(len(image_files))
 
         # Remove empty geo groups (e.g. directory had only non-geo files)
         self._remove_empty_groups(root_group)
 
-        self.layer_panel.tree.collapseAll()
+        # New groups are created collapsed, so there is no collapseAll() pass
+        # here: it would relayout the whole tree and also fold any groups the
+        # user had opened before the import.
 
         if progress.wasCanceled():
             self.statusBar.showMessage(
@@ -2307,6 +2569,8 @@ class MainWindow(QMainWindow):
                 f"Loaded {loaded_count} of {
                     len(image_files)} image files", 5000)
 
+        self._start_overview_build()
+
     def _add_directory_async(self, root_path: Path, image_files: list):
         """Asynchronous directory loading for large imports.
 
@@ -2318,14 +2582,11 @@ class MainWindow(QMainWindow):
 
         # Prepare file list with group paths (prefixed with root folder name)
         files_with_groups = []
-        for file_path in image_files:
-            rel_path = file_path.relative_to(root_path)
-            rel_dir = rel_path.parent
-            rel_dir_str = str(rel_dir).replace(
-                "\\", "/") if rel_dir != Path(".") else ""
+        for file_path, rel_dir_str in zip(
+                image_files, _relative_dirs(root_path, image_files)):
             # Prefix with root group name
             group_path_str = f"{root_group_name}/{rel_dir_str}" if rel_dir_str else root_group_name
-            files_with_groups.append((str(file_path), group_path_str))
+            files_with_groups.append((file_path, group_path_str))
 
         # Use the unified async loader with directory mode
         self._start_unified_async_loading(
@@ -2350,7 +2611,7 @@ class MainWindow(QMainWindow):
             skip_project_add: If True, don't add images to project (they're already there)
         """
         # Store state for the async operation
-        self._async_group_cache: dict[Path, any] = {}
+        self._async_group_cache: dict[str, any] = {}
         self._async_loaded_count = 0
         self._async_total_files = len(files_with_groups)
         self._async_mode = mode
@@ -2405,21 +2666,13 @@ class MainWindow(QMainWindow):
         if not group_path:
             return None
 
-        # Convert to Path for consistency
-        rel_dir = Path(group_path.replace("/", "\\"))
-
-        if rel_dir in self._async_group_cache:
-            return self._async_group_cache[rel_dir]
+        prefixes = _group_prefixes(group_path)
+        cached = self._async_group_cache.get(prefixes[-1][1])
+        if cached is not None:
+            return cached
 
-        # Build path parts
-        parts = group_path.split("/")
         parent = None
-        current_path = ""
-
-        for part in parts:
-            current_path = f"{current_path}/{part}" if current_path else part
-            current_key = Path(current_path.replace("/", "\\"))
-
+        for part, current_key in prefixes:
             if current_key not in self._async_group_cache:
                 # Create group with visible=False for async imports
                 group = self.layer_panel.add_group(part, parent, visible=False)
@@ -2433,7 +2686,7 @@ class MainWindow(QMainWindow):
 
         Uses the 'Non-Georeferenced' tree section in the layer panel.
         """
-        nongeo_key = Path("__nongeo__")
+        nongeo_key = "__nongeo__"
         if nongeo_key not in self._async_group_cache:
             nongeo_root = self.layer_panel.get_or_create_nongeo_root()
             self._async_group_cache[nongeo_key] = nongeo_root
@@ -2442,14 +2695,9 @@ class MainWindow(QMainWindow):
             return self._async_group_cache[nongeo_key]
 
         # Build sub-groups under the non-geo root
-        parts = group_path.split("/")
         parent = self._async_group_cache[nongeo_key]
-        current_path = "__nongeo__"
-
-        for part in parts:
-            current_path = f"{current_path}/{part}"
-            current_key = Path(current_path.replace("/", "\\"))
-
+        for part, prefix in _group_prefixes(group_path):
+            current_key = f"{nongeo_key}/{prefix}"
             if current_key not in self._async_group_cache:
                 group = self.layer_panel.add_nongeo_group(part, parent, visible=False)
                 self._async_group_cache[current_key] = group
@@ -2478,14 +2726,21 @@ class MainWindow(QMainWindow):
         if not self._async_pending_files:
             return
 
-        # Process a smaller batch to keep UI responsive
-        # Each file involves rasterio file opening + tree update
-        batch_size = min(5, len(self._async_pending_files))
+        # Process a bounded batch per tick to keep the UI responsive
+        batch_size = min(ASYNC_UI_BATCH_SIZE, len(self._async_pending_files))
         batch = self._async_pending_files[:batch_size]
         self._async_pending_files = self._async_pending_files[batch_size:]
 
-        # Use batch mode to suppress tree updates during batch processing
+        # Layer rows per parent group, inserted with one add_layers call
+        # each: id(parent) -> (is_geo, parent item, [(layer_id, path), ...])
+        panel_rows: dict[int, tuple[bool, any, list[tuple[str, str]]]] = {}
+        # Project entries for this batch, added with one add_images call
+        project_rows: list[tuple] = []
+
+        # Use batch mode to suppress tree and canvas updates during batch
+        # processing
         self.layer_panel.begin_batch_update()
+        self.canvas.begin_batch_update()
 
         try:
             for file_path, layer_data in batch:
@@ -2500,10 +2755,12 @@ class MainWindow(QMainWindow):
 
                     # Add georeferenced layer with lazy loading
                     layer_id = self.canvas.add_layer(
-                        file_path, lazy=True, visible=False)
+                        file_path, lazy=True, visible=False,
+                        header=layer_data)
                     if layer_id:
-                        self.layer_panel.add_layer(
-                            layer_id, file_path, parent_group, visible=False)
+                        panel_rows.setdefault(
+                            id(parent_group), (True, parent_group, []))[2].append(
+                            (layer_id, file_path))
                         self.canvas.set_layer_group(layer_id, group_path)
                 else:
                     # Non-georeferenced: add to pixel zone
@@ -2511,12 +2768,15 @@ class MainWindow(QMainWindow):
 
                     layer_id = self.canvas.add_pixel_layer(
                         file_path, group_path=group_path, lazy=True,
-                        visible=False)
+                        visible=False, header=layer_data)
                     if layer_id:
-                        self.layer_panel.add_nongeo_layer(
-                            layer_id, file_path, parent_group, visible=False)
+                        panel_rows.setdefault(
+                            id(parent_group), (False, parent_group, []))[2].append(
+                            (layer_id, file_path))
 
                 if layer_id:
+                    if not layer_data.get('overviews'):
+                        self._queue_overview_build(layer_id, file_path)
                     # Track in project with original dimensions (skip for
                     # project loading)
                     if not self._async_skip_project_add:
@@ -2524,12 +2784,19 @@ class MainWindow(QMainWindow):
                         width, height = self.canvas.get_layer_source_dimensions(
                             layer_id)
                         affine, crs = self.canvas.get_layer_transform(layer_id)
-                        self.project.add_image(
-                            file_path, name, group_path, width, height,
-                            affine=affine, crs=crs)
+                        project_rows.append((file_path, name, group_path,
+                                             width, height, affine, crs))
 
                     self._async_loaded_count += 1
         finally:
+            self.project.add_images(project_rows)
+            for is_geo, parent, rows in panel_rows.values():
+                if is_geo:
+                    self.layer_panel.add_layers(rows, parent, visible=False)
+                else:
+                    self.layer_panel.add_nongeo_layers(
+                        rows, parent, visible=False)
+            self.canvas.end_batch_update()
             self.layer_panel.end_batch_update()
 
     def _on_async_file_error(self, file_path: str, error: str):
@@ -2539,12 +2806,13 @@ class MainWindow(QMainWindow):
         self.statusBar.showMessage(f"Failed to load {name}: {error}", 8000)
 
     def _on_async_progress(self, processed: int, total: int):
-        """Handle progress updates during async loading."""
+        """Handle progress updates during async loading.
+
+        Progress goes to the status-bar progress bar only; the status message
+        set when loading started stays put instead of being rewritten on
+        every tick.
+        """
         self._update_progress(processed)
-        self.statusBar.showMessage(
-            f"Loading files: {processed}/{total} ({
-                self._async_loaded_count} added)..."
-        )
 
     def _on_async_batch_complete(self, loaded: int, errors: int):
         """Handle async loading completion for both directory and project modes."""
@@ -2552,15 +2820,21 @@ class MainWindow(QMainWindow):
         self._async_ui_timer.stop()
 
         # Process any remaining pending files with progress events
+        # (pumping events every few batches to keep the UI responsive)
+        drained = 0
         while self._async_pending_files:
             self._process_pending_async_files()
-            QApplication.processEvents()  # Keep UI responsive during final batch
+            drained += 1
+            if drained % 4 == 0:
+                QApplication.processEvents()
 
         # Hide progress indicator
         self._hide_progress()
+        self.progress_cancel_button.hide()
 
-        # Collapse all groups (user expands as needed)
-        self.layer_panel.tree.collapseAll()
+        # Groups are created collapsed (user expands as needed); skipping
+        # collapseAll() avoids a whole-tree relayout and keeps groups the
+        # user opened while the load was running.
 
         # Clean up loader
         if hasattr(self, '_async_loader') and self._async_loader is not None:
@@ -2574,6 +2848,8 @@ class MainWindow(QMainWindow):
         else:
             self._finish_async_loading_directory(errors)
 
+        self._start_overview_build()
+
     def _finish_async_loading_directory(self, errors: int = 0):
         """Complete directory loading after all files are processed."""
         # Remove empty geo groups (e.g. directory had only non-geo files)
@@ -2582,6 +2858,8 @@ class MainWindow(QMainWindow):
                 self._remove_empty_groups(item)
 
         msg = f"Loaded {self._async_loaded_count} GeoTIFF files"
+        if self._dir_import_cancelled:
+            msg = f"Import cancelled. {msg}"
         if errors > 0:
             msg += f" ({errors} errors)"
         msg += ". Check layers to display."
@@ -2655,6 +2933,7 @@ class MainWindow(QMainWindow):
         # Remove on-screen tiles on the main thread before freeing data
         for lid, layer in layers:
             layer.free_data(self.canvas._scene)
+            self.canvas.drop_cached_tiles(layer.file_path)
 
         QMessageBox.information(
             self, "Free Group",
@@ -2737,19 +3016,93 @@ class MainWindow(QMainWindow):
         """Log a per-layer preload failure."""
         print(f"Group preload error on {layer_id}: {msg}")
 
+    def _queue_overview_build(self, layer_id: str, file_path: str):
+        """Queue a newly imported layer for overview building if enabled."""
+        if not self._build_overviews_on_import:
+            return
+        layer = self.canvas.get_layer(layer_id)
+        if layer is not None and not layer.has_overviews():
+            self._overview_queue.append((layer_id, file_path))
+
+    def _start_overview_build(self):
+        """Build overviews for queued layers on a background worker.
+
+        Runs without a modal dialog (progress goes to the status bar) so the
+        user can keep working. If a build is already running, the queue is
+        picked up when it finishes.
+        """
+        if not self._overview_queue or self._overview_thread is not None:
+            return
+        layers = self._overview_queue
+        self._overview_queue = []
+
+        thread = QThread(self)
+        worker = OverviewBuildWorker(layers)
+        worker.moveToThread(thread)
+
+        self._overview_thread = thread
+        self._overview_worker = worker
+
+        worker.progress.connect(self._on_overview_progress)
+        worker.layer_built.connect(self._on_overview_layer_built)
+        worker.finished.connect(self._on_overview_finished)
+        thread.started.connect(worker.process)
+        thread.finished.connect(self._on_overview_thread_finished)
+
+        thread.start()
+
+    def _on_overview_progress(self, index: int, total: int, filename: str):
+        """Report overview-build progress in the status bar (main thread)."""
+        self.statusBar.showMessage(
+            f"Building overviews {index + 1}/{total}: {filename}")
+
+    def _on_overview_layer_built(self, layer_id: str, result: dict):
+        """Point the live layer at its new overviews (main thread)."""
+        layer = self.canvas.get_layer(layer_id)
+        if layer is not None:
+            layer.set_overview_metadata(
+                result['overviews'], result['level_dims'])
+
+    def _on_overview_finished(self, built: int, errors):
+        """Summarize the overview build and stop the worker thread."""
+        if self._overview_thread is not None:
+            self._overview_thread.quit()
+        msg = f"Built overviews for {built} image(s)"
+        if errors:
+            msg += f" ({len(errors)} could not be written)"
+            for path, err in errors:
+                print(f"Warning: Could not build overviews for {path}: {err}")
+        self.statusBar.showMessage(msg, 5000)
+
+    def _on_overview_thread_finished(self):
+        """Refresh tiles at the new levels and run any queued builds."""
+        self._overview_thread = None
+        self._overview_worker = None
+        self.canvas._update_visible_tiles()
+        self._start_overview_build()
+
     def _show_progress(self, maximum: int, label: str = "Loading"):
         """Show the progress indicator with a maximum value."""
+        self._progress_timer.stop()
+        self._progress_value = 0
         self.progress_indicator.setMaximum(maximum)
         self.progress_indicator.setValue(0)
         self.progress_indicator.setFormat(f"{label}: %p% (%v/%m)")
         self.progress_indicator.show()
 
     def _update_progress(self, value: int):
-        """Update the progress indicator value."""
-        self.progress_indicator.setValue(value)
+        """Record the progress value; the bar is repainted on the next tick."""
+        self._progress_value = value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _apply_progress(self):
+        """Show the latest recorded progress value."""
+        self.progress_indicator.setValue(self._progress_value)
 
     def _hide_progress(self):
         """Hide the progress indicator."""
+        self._progress_timer.stop()
         self.progress_indicator.hide()
         self.progress_indicator.setValue(0)
 
@@ -2757,33 +3110,34 @@ class MainWindow(QMainWindow):
                             layer_name: str, group_path: str,
                             is_pixel: bool = False):
         """Update the coordinate display in the status bar."""
+        if is_pixel:
+            # Non-georeferenced image: show pixel coordinates
+            coords = f"Pixel: ({x:.1f}, {y:.1f})"
+        else:
+            coords = f"Lon: {x:.6f}°  Lat: {y:.6f}°"
+
         if layer_name:
-            # Build display name with group path if present
-            if group_path:
-                display_name = f"{group_path}/{layer_name.lstrip('~')}"
-            else:
-                display_name = layer_name.lstrip('~')
-
-            if is_pixel:
-                # Non-georeferenced image: show pixel coordinates
-                self.coord_label.setText(
-                    f"Pixel: ({x:.1f}, {y:.1f})  |  Image: {display_name}")
-            elif layer_name.startswith("~"):
-                # Layer name prefixed with ~ means "closest to"
-                self.coord_label.setText(
-                    f"Lon: {
-                        x:.6f}°  Lat: {
-                        y:.6f}°  |  Nearest: {display_name}")
+            # Display name (with group path if present) is resolved once per
+            # layer/group pair rather than on every mouse move.
+            key = (layer_name, group_path)
+            display_name = self._layer_display_cache.get(key)
+            if display_name is None:
+                name = layer_name.lstrip('~')
+                display_name = f"{group_path}/{name}" if group_path else name
+                self._layer_display_cache[key] = display_name
+
+            # Layer name prefixed with ~ means "closest to"
+            if not is_pixel and layer_name.startswith("~"):
+                text = f"{coords}  |  Nearest: {display_name}"
             else:
-                self.coord_label.setText(
-                    f"Lon: {
-                        x:.6f}°  Lat: {
-                        y:.6f}°  |  Image: {display_name}")
+                text = f"{coords}  |  Image: {display_name}"
         else:
-            if is_pixel:
-                self.coord_label.setText(f"Pixel: ({x:.1f}, {y:.1f})")
-            else:
-                self.coord_label.setText(f"Lon: {x:.6f}°  Lat: {y:.6f}°")
+            text = coords
+
+        # Skip setText (and the status bar relayout) when nothing changed
+        if text != self._last_coord_text:
+            self._last_coord_text = text
+            self.coord_label.setText(text)
 
     def _on_layer_group_changed(self, layer_id: str, group_path: str):
         """Handle layer group change - update both canvas and project."""
@@ -2906,6 +3260,11 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Handle window close - ensure async loaders are properly cleaned up."""
+        # Let an in-flight save finish so the project file is complete
+        if self._save_thread is not None and self._save_thread.isRunning():
+            self._save_thread.quit()
+            self._save_thread.wait()
+
         # Clean up crash detection and recovery
         self._clean_exit()
 
@@ -2926,6 +3285,32 @@ class MainWindow(QMainWindow):
             self._group_mem_thread = None
             self._group_mem_worker = None
 
+        # Stop any sub-image export after its in-flight labels
+        if self._subimage_thread is not None:
+            if self._subimage_thread.isRunning():
+                if self._subimage_worker:
+                    self._subimage_worker.cancel()
+                self._subimage_thread.quit()
+                self._subimage_thread.wait()
+            self._subimage_thread = None
+            self._subimage_worker = None
+
+        # Stop any directory scan, including superseded ones still unwinding
+        self._retire_directory_scan()
+        for thread, _worker in list(self._retired_dir_scans):
+            thread.wait()
+        self._retired_dir_scans.clear()
+
+        # Stop any overview build between files
+        if self._overview_thread is not None:
+            if self._overview_thread.isRunning():
+                if self._overview_worker:
+                    self._overview_worker.cancel()
+                self._overview_thread.quit()
+                self._overview_thread.wait()
+            self._overview_thread = None
+            self._overview_worker = None
+
         # Stop the UI timers if running
         if hasattr(self, '_async_ui_timer'):
             self._async_ui_timer.stop()
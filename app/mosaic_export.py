@@ -81,15 +81,30 @@ def _color_spec(native_count, mode, colormap):
     return 3, [ColorInterp.red, ColorInterp.green, ColorInterp.blue], None
 
 
+def _luminance(buf):
+    """Return the Rec. 601 luminance of bands 1-3 in the block's dtype.
+
+    Accumulates into one float buffer with in-place multiply/add (float32 for
+    8/16-bit data, which it represents exactly) instead of materialising
+    three float64 band copies and the temporaries of their weighted sum.
+    """
+    dtype = buf.dtype
+    work = (np.float32 if dtype.kind in "ui" and dtype.itemsize <= 2
+            else np.float64)
+    lum = np.multiply(buf[0], work(0.299), dtype=work)
+    tmp = np.empty_like(lum)
+    np.multiply(buf[1], work(0.587), out=tmp)
+    lum += tmp
+    np.multiply(buf[2], work(0.114), out=tmp)
+    lum += tmp
+    return lum.astype(dtype)
+
+
 def _convert_block(buf, native_count, mode, colormap):
     """Convert a native (native_count,H,W) block to the output colour mode."""
-    dtype = buf.dtype
     if mode == "Grayscale":
         if native_count >= 3:
-            lum = (0.299 * buf[0].astype("float64")
-                   + 0.587 * buf[1].astype("float64")
-                   + 0.114 * buf[2].astype("float64"))
-            return lum.astype(dtype)[np.newaxis, ...]
+            return _luminance(buf)[np.newaxis, ...]
         return buf[:1]
     if mode == "Palette":
         return buf[:1]
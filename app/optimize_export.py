@@ -11,6 +11,9 @@ Contents:
 - ``plan_output_path`` - map a layer's (group, file) to its output path.
 - ``OptimizeWorker`` - a QObject worker that runs conversions off the UI thread.
 - ``OptimizeExportDialog`` - the setup dialog shown to the user.
+- ``build_sidecar_overviews`` / ``OverviewBuildWorker`` - add external
+  ``.ovr`` pyramids to loaded files in place (Options -> Build overviews on
+  import).
 """
 import os
 import re
@@ -187,6 +190,44 @@ class _Cancelled(Exception):
     """Internal signal used to abort a conversion mid-file."""
 
 
+def _overview_info(path) -> tuple[list[int], list[tuple[int, int]]]:
+    """Return (decimation factors, per-level (width, height)) for a file."""
+    with rasterio.open(path) as src:
+        try:
+            factors = list(src.overviews(1))
+        except Exception:
+            factors = []
+        dims = [(max(1, src.width // f), max(1, src.height // f))
+                for f in factors]
+    return factors, dims
+
+
+def build_sidecar_overviews(path, overviews=DEFAULT_OVERVIEWS,
+                            resampling=Resampling.average):
+    """Add pyramid overviews to ``path`` as an external ``.ovr`` sidecar.
+
+    Files that already have overviews are left untouched. ``TIFF_USE_OVR``
+    makes GDAL write the pyramid next to the source instead of rewriting the
+    GeoTIFF itself. Paletted rasters are overviewed with nearest-neighbour.
+
+    Returns:
+        ``(factors, level_dims, built)`` describing the file's overviews after
+        the call; ``built`` is True only if new overviews were written.
+    """
+    factors, dims = _overview_info(path)
+    if factors:
+        return factors, dims, False
+
+    with rasterio.Env(TIFF_USE_OVR=True):
+        with rasterio.open(path, "r+") as ds:
+            overview_resampling = (
+                Resampling.nearest if _has_colormap(ds) else resampling)
+            ds.build_overviews(list(overviews), overview_resampling)
+
+    factors, dims = _overview_info(path)
+    return factors, dims, bool(factors)
+
+
 class OptimizeWorker(QObject):
     """Runs a batch of GeoTIFF optimizations off the UI thread.
 
@@ -245,6 +286,53 @@ class OptimizeWorker(QObject):
         self.finished.emit(done, skipped, errors)
 
 
+class OverviewBuildWorker(QObject):
+    """Builds missing sidecar overviews for loaded layers off the UI thread.
+
+    ``layer_built`` carries the new overview metadata so the main thread can
+    update the live layer, which then picks coarser levels when zoomed out.
+    Files on read-only storage fail individually and are reported in
+    ``finished``.
+    """
+
+    progress = pyqtSignal(int, int, str)    # (index, total, filename)
+    layer_built = pyqtSignal(str, object)   # (layer_id, {overviews, level_dims})
+    finished = pyqtSignal(int, object)      # (built, errors list)
+
+    def __init__(self, layers):
+        """Store the layers to process.
+
+        Args:
+            layers: list of (layer_id, file_path) tuples.
+        """
+        super().__init__()
+        self._layers = layers
+        self._cancelled = False
+
+    def cancel(self):
+        """Request cancellation (checked between files)."""
+        self._cancelled = True
+
+    def process(self):
+        """Build overviews for each layer, emitting progress and a summary."""
+        total = len(self._layers)
+        built = 0
+        errors = []
+        for i, (layer_id, path) in enumerate(self._layers):
+            if self._cancelled:
+                break
+            self.progress.emit(i, total, os.path.basename(path))
+            try:
+                factors, dims, new = build_sidecar_overviews(path)
+                if new:
+                    built += 1
+                    self.layer_built.emit(
+                        layer_id, {'overviews': factors, 'level_dims': dims})
+            except Exception as e:  # noqa: BLE001 - report, keep going
+                errors.append((path, str(e)))
+        self.finished.emit(built, errors)
+
+
 class OptimizeExportDialog(QDialog):
     """Setup dialog for the "Optimized GeoTIFFs" export.
 
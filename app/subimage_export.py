@@ -0,0 +1,490 @@
+"""Export label-centred sub-images as GeoTIFFs.
+
+Powers Export -> Sub-images. For every label a square ground region of the
+requested size is cut from the source image around the label's pixel and
+written unmodified (all bands, original dtype, CRS/transform, nodata and colour
+interpretation preserved) to ``<output>/<class_name>/<object_id>_<id>.tif``.
+
+Contents:
+- ``ground_res_per_pixels`` - true ground metres per pixel at many pixels of
+  an image, any CRS (``ground_res_per_pixel`` for a single pixel).
+- ``export_label_subimage`` - cut and write one label's window (no Qt).
+- ``SubimageExportWorker`` - a QObject worker that runs the export off the UI
+  thread, fanning source images out to a QThreadPool.
+
+rasterio releases the GIL while decoding and encoding, so several labels are
+exported in parallel. Jobs are per source image, split into runs of nearby
+labels for heavily labelled images: each job opens its own dataset handle
+(and builds its CRS transformer) once and exports all of its labels.
+Decoding compressed (JPEG/LZW/DEFLATE) sources is CPU-bound, so the pool is
+sized to the machine's cores rather than a fixed small count.
+"""
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import rasterio
+import rasterio.shutil
+from pyproj import Transformer
+from PyQt5.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+from .labels import EARTH_RADIUS_M, PointLabel
+
+# Upper bound on concurrent image jobs. Decoding and encoding run in GDAL
+# without the GIL and scale with cores; the cap only keeps very wide
+# machines from opening dozens of datasets against the same disk at once.
+EXPORT_MAX_THREADS = 16
+
+# Labels per pool job. An image with more labels is split into several jobs
+# (each with its own dataset handle) so one dense image still uses several
+# threads; smaller values mean more dataset opens.
+EXPORT_LABELS_PER_JOB = 64
+
+# Block size for tiled sub-image output. Crops smaller than one block in
+# either dimension stay striped, since tiling them would only add padding.
+EXPORT_TILE_SIZE = 256
+
+# Compression options (UI label -> GDAL value). ZSTD at a low level writes
+# the many small files of an export markedly faster than LZW and smaller.
+COMPRESSION_CHOICES = {
+    "ZSTD (recommended)": "ZSTD",
+    "DEFLATE": "DEFLATE",
+    "LZW": "LZW",
+    "None": "NONE",
+}
+
+
+@lru_cache(maxsize=None)
+def compression_supported(compress: str) -> bool:
+    """Return True if this GDAL build can write GeoTIFFs with ``compress``.
+
+    Probed once per codec by creating a 1x1 in-memory file, since ZSTD is an
+    optional GDAL build feature.
+    """
+    if compress.upper() == "NONE":
+        return True
+    probe = f"/vsimem/subimage_probe_{compress.lower()}.tif"
+    try:
+        with rasterio.open(probe, 'w', driver='GTiff', width=1, height=1,
+                           count=1, dtype='uint8', compress=compress.lower()):
+            pass
+        return True
+    except Exception:
+        return False
+    finally:
+        try:
+            rasterio.shutil.delete(probe)
+        except Exception:
+            pass
+
+
+def compression_options(compress: str, dtype) -> dict:
+    """Return GTiff creation options for a compression choice and dtype.
+
+    Falls back to LZW (or no compression) when the requested codec isn't
+    available. Adds the horizontal (integer) or floating-point predictor for
+    real sample types, which shrinks imagery noticeably for the same codec.
+    """
+    comp = (compress or "NONE").upper()
+    if not compression_supported(comp):
+        comp = "LZW" if compression_supported("LZW") else "NONE"
+    if comp == "NONE":
+        return {}
+    options = {'compress': comp.lower()}
+    # GDAL only supports predictors for real integer (2) and floating-point
+    # (3) samples; complex types are written without one
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        options['predictor'] = 2
+    elif np.issubdtype(dtype, np.floating):
+        options['predictor'] = 3
+    if comp == "ZSTD":
+        options['zstd_level'] = 1
+    return options
+
+
+def tiling_options(width: int, height: int) -> dict:
+    """Return GTiff tiling options for an output of ``width`` x ``height``.
+
+    Crops at least one block in both dimensions are written tiled, which
+    makes later windowed reads of the exported files cheaper.
+    """
+    if width < EXPORT_TILE_SIZE or height < EXPORT_TILE_SIZE:
+        return {}
+    return {'tiled': True, 'blockxsize': EXPORT_TILE_SIZE,
+            'blockysize': EXPORT_TILE_SIZE}
+
+
+def _haversine_m(lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray,
+                 lon2: np.ndarray) -> np.ndarray:
+    """Vectorized ``haversine_distance``: metres between WGS84 point pairs."""
+    lat1_r = np.radians(lat1)
+    lat2_r = np.radians(lat2)
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = (np.sin(dlat / 2) ** 2
+         + np.cos(lat1_r) * np.cos(lat2_r) * np.sin(dlon / 2) ** 2)
+    return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def ground_res_per_pixels(src, px: np.ndarray, py: np.ndarray,
+                          transformer: Transformer | None = None
+                          ) -> tuple[np.ndarray, np.ndarray]:
+    """Measure true ground metres per pixel at many pixels of one image.
+
+    Projects each pixel and its immediate right/below neighbours to WGS84
+    and takes geodesic (Haversine) distances, so the result is correct for
+    projected, geographic and Web Mercator sources alike (the last of which
+    has a cos(lat) scale factor that raw transform coefficients ignore) and
+    for non-square pixels. All pixels go through the transformer and the
+    distance formula as arrays, in one call each.
+
+    Pass ``transformer`` (``src.crs`` -> EPSG:4326, always_xy) when measuring
+    several batches of the same image; building one is far costlier than
+    using it.
+
+    Returns (metres_per_pixel_x, metres_per_pixel_y) arrays. Pixels whose
+    size can't be determined get (0, 0); if the transform itself fails, all
+    entries are zero.
+    """
+    px = np.asarray(px, dtype=np.float64)
+    py = np.asarray(py, dtype=np.float64)
+    try:
+        if transformer is None:
+            transformer = Transformer.from_crs(src.crs, 4326, always_xy=True)
+        t = src.transform
+        # Pixel corner, its right neighbour and its lower neighbour.
+        xs = np.concatenate([px, px + 1, px])
+        ys = np.concatenate([py, py, py + 1])
+        lon, lat = transformer.transform(t.a * xs + t.b * ys + t.c,
+                                         t.d * xs + t.e * ys + t.f)
+        lon = np.asarray(lon).reshape(3, -1)
+        lat = np.asarray(lat).reshape(3, -1)
+        mppx = _haversine_m(lat[0], lon[0], lat[1], lon[1])
+        mppy = _haversine_m(lat[0], lon[0], lat[2], lon[2])
+        # Zero only the pixels without a finite size, so one bad label
+        # doesn't fail the rest of the batch
+        valid = np.isfinite(mppx) & np.isfinite(mppy)
+        return np.where(valid, mppx, 0.0), np.where(valid, mppy, 0.0)
+    except Exception:
+        return np.zeros_like(px), np.zeros_like(py)
+
+
+def ground_res_per_pixel(src, px: int, py: int,
+                         transformer: Transformer | None = None
+                         ) -> tuple[float, float]:
+    """Measure true ground metres per pixel at one pixel, for any CRS.
+
+    Single-pixel form of ``ground_res_per_pixels``.
+
+    Returns (metres_per_pixel_x, metres_per_pixel_y); (0, 0) if it can't be
+    determined.
+    """
+    mppx, mppy = ground_res_per_pixels(src, [px], [py], transformer)
+    return float(mppx[0]), float(mppy[0])
+
+
+class ReadBuffer:
+    """Grow-only scratch array reused for the window reads of one image.
+
+    Each label's window is read into a contiguous view of the same
+    allocation and written out before the next read, so an image's labels
+    cost one allocation (plus regrowth) instead of one each.
+    """
+
+    def __init__(self, dtype):
+        """Create an empty buffer for the given dtype."""
+        self._data = np.empty(0, dtype=dtype)
+
+    def view(self, shape: tuple[int, ...]) -> np.ndarray:
+        """Return a C-contiguous array of ``shape`` backed by the buffer."""
+        size = int(np.prod(shape))
+        if self._data.size < size:
+            self._data = np.empty(size, dtype=self._data.dtype)
+        return self._data[:size].reshape(shape)
+
+
+def export_label_subimage(src, label: PointLabel, size_meters: float,
+                          output_path: Path,
+                          transformer: Transformer | None = None,
+                          pixel_res: tuple[float, float] | None = None,
+                          buffer: ReadBuffer | None = None,
+                          compress: str = "LZW",
+                          create_dirs: bool = True) -> str | None:
+    """Cut the window around one label from an open dataset and write it.
+
+    Args:
+        src: Open rasterio dataset of the label's source image
+        label: The label to centre the sub-image on
+        size_meters: Width and height of the sub-image in ground metres
+        output_path: Export root; files go into a per-class subdirectory
+        transformer: Optional cached ``src.crs`` -> WGS84 transformer
+        pixel_res: Optional precomputed ground metres per pixel (x, y) at the
+            label, e.g. from a ``ground_res_per_pixels`` batch
+        buffer: Optional scratch buffer (dtype of every band) to read the
+            window into instead of allocating a new array
+        compress: GDAL compression name (see ``COMPRESSION_CHOICES``)
+        create_dirs: Create the class directory if needed; pass False when
+            the caller has already created every class directory
+
+    Returns:
+        None on success, otherwise a message describing why the label was
+        skipped.
+    """
+    # Label pixel in the ORIGINAL image (absolute pixel coords)
+    pixel_x = int(round(label.pixel_x))
+    pixel_y = int(round(label.pixel_y))
+
+    # Skip if pixel coordinates are outside image bounds
+    if (pixel_x < 0 or pixel_x >= src.width
+            or pixel_y < 0 or pixel_y >= src.height):
+        return (f"Label {label.id}: pixel coords "
+                f"({pixel_x}, {pixel_y}) outside image bounds "
+                f"({src.width}x{src.height})")
+
+    # True ground metres per pixel at the label, measured from the actual
+    # pixel geometry so it is correct for any CRS (projected, geographic, or
+    # Web Mercator) and for non-square pixels.
+    if pixel_res is None:
+        pixel_res = ground_res_per_pixel(src, pixel_x, pixel_y, transformer)
+    pixel_width_m, pixel_height_m = pixel_res
+    if pixel_width_m <= 0 or pixel_height_m <= 0:
+        return f"Label {label.id}: could not determine pixel resolution"
+
+    # Pixels spanning the requested square ground region.
+    half_size_px_x = max(1, int((size_meters / 2) / pixel_width_m))
+    half_size_px_y = max(1, int((size_meters / 2) / pixel_height_m))
+    full_size_px_x = half_size_px_x * 2
+    full_size_px_y = half_size_px_y * 2
+
+    # Window centred on the label, shifted (not shrunk) to stay inside the
+    # image where it fits, and clipped to the image where it doesn't.
+    col_start = max(0, min(pixel_x - half_size_px_x,
+                           src.width - full_size_px_x))
+    col_end = min(src.width, col_start + full_size_px_x)
+    row_start = max(0, min(pixel_y - half_size_px_y,
+                           src.height - full_size_px_y))
+    row_end = min(src.height, row_start + full_size_px_y)
+
+    window_width = col_end - col_start
+    window_height = row_end - row_start
+
+    # Skip if the resulting window is too small or invalid
+    if window_width <= 0 or window_height <= 0:
+        return f"Label {label.id}: invalid window size, skipped"
+
+    if (window_width < full_size_px_x // 2
+            or window_height < full_size_px_y // 2):
+        return f"Label {label.id} too close to edge, skipped"
+
+    # Read the window using bounded reading
+    window = rasterio.windows.Window(
+        col_off=col_start,
+        row_off=row_start,
+        width=window_width,
+        height=window_height
+    )
+
+    # Use boundless=False to ensure we stay within image bounds
+    out = None
+    if buffer is not None:
+        out = buffer.view((src.count, window_height, window_width))
+    data = src.read(window=window, out=out, boundless=False)
+
+    # Output directory for this class
+    class_dir = output_path / label.class_name
+    if create_dirs:
+        class_dir.mkdir(parents=True, exist_ok=True)
+
+    # Generate unique filename: {object_id}_{label_id:06d}.tif
+    out_filename = f"{label.object_id}_{label.id:06d}.tif"
+    out_path = class_dir / out_filename
+
+    # Calculate the transform for the sub-image window (preserves original CRS)
+    window_transform = rasterio.windows.transform(window, src.transform)
+
+    # Write the cropped pixels unmodified: all source bands at the original
+    # dtype, preserving CRS/transform, colour interpretation and nodata so RGB
+    # (or any multi-band) data round-trips exactly.
+    with rasterio.open(
+        out_path,
+        'w',
+        driver='GTiff',
+        height=window_height,
+        width=window_width,
+        count=data.shape[0],
+        dtype=data.dtype,
+        crs=src.crs,
+        transform=window_transform,
+        nodata=src.nodata,
+        **compression_options(compress, data.dtype),
+        **tiling_options(window_width, window_height)
+    ) as dst:
+        dst.write(data)
+        # Preserve per-band colour interpretation (RGB tagging).
+        try:
+            dst.colorinterp = src.colorinterp
+        except Exception:
+            pass
+
+    return None
+
+
+class _ImageExportRunnable(QRunnable):
+    """Export a run of one source image's sub-images on a pool thread."""
+
+    def __init__(self, worker: "SubimageExportWorker", image_path: str,
+                 labels: list[PointLabel]):
+        """Store the owning worker, the source image and its labels."""
+        super().__init__()
+        self._worker = worker
+        self._image_path = image_path
+        self._labels = labels
+
+    def _fail_all(self, error: str):
+        """Report every label of this image as failed with the same error."""
+        for _label in self._labels:
+            self._worker._label_done(False, error)
+
+    def run(self):
+        """Open the source once and export its labels, reporting each one.
+
+        Labels arrive in raster (row-major) order, so neighbouring windows
+        reuse tiles still in GDAL's block cache (sized by GDAL_CACHEMAX in
+        main.py) instead of decoding them again.
+        """
+        worker = self._worker
+        image_path = self._image_path
+        if worker.is_cancelled():
+            for _label in self._labels:
+                worker._label_done(False, None)
+            return
+
+        try:
+            # Private handle: several jobs may read the same image at once
+            with rasterio.open(image_path, sharing=False) as src:
+                # Handle missing CRS
+                if src.crs is None:
+                    self._fail_all(f"Image has no CRS: {image_path}")
+                    return
+                transformer = Transformer.from_crs(
+                    src.crs, 4326, always_xy=True)
+                labels = self._labels
+                # Pixel sizes at every label of this image in one batch
+                pxs = np.rint([label.pixel_x for label in labels])
+                pys = np.rint([label.pixel_y for label in labels])
+                res_x, res_y = ground_res_per_pixels(
+                    src, pxs, pys, transformer)
+                # One read buffer for all windows of this image (only when
+                # every band shares a dtype; mixed images read as before)
+                buffer = (ReadBuffer(src.dtypes[0])
+                          if len(set(src.dtypes)) == 1 else None)
+
+                for i, label in enumerate(labels):
+                    if worker.is_cancelled():
+                        worker._label_done(False, None)
+                        continue
+                    try:
+                        error = export_label_subimage(
+                            src, label, worker.size_meters,
+                            worker.output_path, transformer,
+                            (float(res_x[i]), float(res_y[i])), buffer,
+                            worker.compress, create_dirs=False)
+                    except Exception as e:
+                        error = (f"Error processing label {label.id} "
+                                 f"from {image_path}: {e}")
+                    worker._label_done(error is None, error)
+        except Exception as e:
+            # Opening the source failed before any label was reported
+            self._fail_all(f"Error opening {image_path}: {e}")
+
+
+class SubimageExportWorker(QObject):
+    """Runs a sub-image export off the UI thread.
+
+    ``process`` (run on a QThread) submits one job per image to a private
+    QThreadPool and blocks until they finish; jobs report progress through
+    the worker's signals, which are delivered queued to the UI thread.
+    """
+
+    progress = pyqtSignal(int, int)              # (labels processed, total)
+    finished = pyqtSignal(int, object, bool)     # (exported, errors, cancelled)
+
+    def __init__(self, jobs: list[tuple[str, list[PointLabel]]],
+                 size_meters: float, output_path: Path,
+                 compress: str = "ZSTD",
+                 max_threads: int = EXPORT_MAX_THREADS):
+        """Store the export inputs.
+
+        Args:
+            jobs: (image_path, labels) pairs, one per source image
+            size_meters: Width and height of each sub-image in ground metres
+            output_path: Export root directory
+            compress: GDAL compression for the written sub-images
+            max_threads: Maximum number of images exported concurrently
+                (further limited to the number of CPU cores)
+        """
+        super().__init__()
+        self._jobs = jobs
+        self.size_meters = size_meters
+        self.output_path = output_path
+        self.compress = compress
+        self._max_threads = max(
+            1, min(max_threads, QThread.idealThreadCount()))
+        self._cancel_event = threading.Event()
+        self._lock = threading.Lock()
+        self._processed = 0
+        self._total = sum(len(labels) for _path, labels in jobs)
+        self._exported = 0
+        self._errors: list[str] = []
+
+    def cancel(self):
+        """Request cancellation; queued labels are skipped."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        """Return True once cancellation has been requested."""
+        return self._cancel_event.is_set()
+
+    def _label_done(self, exported: bool, error: str | None):
+        """Record one finished label (called from pool threads)."""
+        with self._lock:
+            self._processed += 1
+            if exported:
+                self._exported += 1
+            if error:
+                self._errors.append(error)
+            processed = self._processed
+        self.progress.emit(processed, self._total)
+
+    def process(self):
+        """Export all labels and emit the summary."""
+        # Probe codec support (and the LZW fallback) once here, so pool
+        # threads only read the cached results
+        compression_supported(self.compress)
+        compression_supported("LZW")
+
+        # Create each class directory once up front rather than per label
+        class_names = {label.class_name
+                       for _path, labels in self._jobs for label in labels}
+        for class_name in class_names:
+            try:
+                (self.output_path / class_name).mkdir(
+                    parents=True, exist_ok=True)
+            except OSError as e:
+                self._errors.append(
+                    f"Could not create directory for class {class_name}: {e}")
+        pool = QThreadPool()
+        pool.setMaxThreadCount(self._max_threads)
+        for image_path, labels in self._jobs:
+            # Raster order keeps each run spatially compact
+            labels = sorted(
+                labels, key=lambda label: (label.pixel_y, label.pixel_x))
+            for start in range(0, len(labels), EXPORT_LABELS_PER_JOB):
+                pool.start(_ImageExportRunnable(
+                    self, image_path,
+                    labels[start:start + EXPORT_LABELS_PER_JOB]))
+        pool.waitForDone()
+        self.finished.emit(
+            self._exported, list(self._errors), self.is_cancelled())
@@ -96,6 +96,18 @@ build_exe_options = {
         "concurrent",
         "multiprocessing",
         "test",
+        # Unused stdlib packages (fewer entries in library.zip to scan at
+        # startup)
+        "pydoc_data",
+        "distutils",
+        "lib2to3",
+        "sqlite3",
+        "xmlrpc",
+        "idlelib",
+        "turtledemo",
+        "ensurepip",
+        "venv",
+        "ctypes.test",
         # Exclude Qt modules we don't use (avoid QML path issues)
         "PyQt5.QtQml",
         "PyQt5.QtQuick",
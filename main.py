@@ -15,6 +15,13 @@ if getattr(sys, 'frozen', False):
     os.environ['PROJ_DATA'] = os.path.join(_frozen_root, 'proj_data')
     os.environ['GDAL_DATA'] = os.path.join(_frozen_root, 'gdal_data')
 
+# Cap GDAL's raster block cache (in MB; GDAL's default is 5% of RAM). The
+# canvas reads each level into its own RGBA array and caches the converted
+# tile pixmaps, so GDAL blocks are only needed for the duration of a read and
+# a large block cache would just hold a second copy of the same pixels. Set
+# before rasterio is imported; a value from the environment wins.
+os.environ.setdefault('GDAL_CACHEMAX', '512')
+
 
 def _get_log_dir() -> Path:
     """Return a writable location for startup crash logs."""
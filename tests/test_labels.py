@@ -0,0 +1,39 @@
+"""Tests for the label data model."""
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("rasterio")
+pytest.importorskip("pyproj")
+
+from app.labels import LabelProject  # noqa: E402
+
+
+def _project_with_labels() -> LabelProject:
+    project = LabelProject()
+    project.classes = ["car", "tree"]
+    for class_name in ("car", "car", "tree"):
+        project.add_label(class_name, 1.0, 2.0, 0.0, 0.0,
+                          "img", image_path="/data/img.tif")
+    return project
+
+
+def test_set_classes_removes_labels_of_dropped_classes():
+    project = _project_with_labels()
+
+    project.set_classes(["tree"])
+
+    assert project.classes == ["tree"]
+    assert project.label_count == 1
+    assert [l.class_name for l in project.images["/data/img.tif"].labels] \
+        == ["tree"]
+    assert project.count_labels_in_classes({"car"}) == 0
+
+
+def test_remove_class_after_class_list_update():
+    project = _project_with_labels()
+
+    project.classes = ["tree"]
+    project.remove_class("car")
+
+    assert project.label_count == 1
+    assert project.count_labels_in_classes({"car"}) == 0